@@ -0,0 +1,303 @@
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import parse_qs
+
+# Admission control
+#
+# Every /api request is classified into a route class. A request must get a
+# token from its client's bucket for that class (429 otherwise), then a slot
+# in the class's concurrency gate, then a slot in the worker-wide gate. Gates
+# have bounded wait queues (503 when full or when the wait times out) and the
+# worker-wide gate hands free slots to the highest priority waiter first, so
+# interactive reads overtake queued exports.
+#
+# Rate limits are per client: the peer IP, or the X-API-Key header when it
+# names one of the keys in ADMISSION_API_KEYS (comma separated). Unknown keys
+# are ignored, otherwise a client could rotate keys to get fresh buckets.
+#
+# All state (buckets, gates, queues) lives in the worker process, so every
+# limit below is per worker: under serve.py with WEB_CONCURRENCY=N a client
+# can get up to N times the rate and concurrency. Each class limit can be
+# overridden with ADMISSION_<CLASS>_<LIMIT>, e.g. ADMISSION_SEARCH_RATE=20 or
+# ADMISSION_BULK_MAX_CONCURRENT=1, and ADMISSION_ENABLED=0 turns admission off
+# (for benchmarks behind a gateway that already enforces limits).
+
+
+class RouteClass:
+    def __init__(self, name: str, priority: int, max_concurrent: int, max_queue: int,
+                 rate: float, burst: int, queue_timeout: float = 10.0):
+        self.name = name
+        self.priority = priority  # lower runs first
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.rate = rate  # tokens per second, per client
+        self.burst = burst
+        self.queue_timeout = queue_timeout
+
+
+ROUTE_CLASSES = {
+    "interactive": RouteClass("interactive", 0, max_concurrent=64, max_queue=256, rate=50, burst=100),
+    "search": RouteClass("search", 1, max_concurrent=16, max_queue=64, rate=10, burst=20),
+    "stats": RouteClass("stats", 2, max_concurrent=4, max_queue=16, rate=2, burst=5),
+    # Finished export files: cheap sequential reads that clients resume with
+    # Range requests, so they get their own, more generous budget
+    "download": RouteClass("download", 2, max_concurrent=8, max_queue=32, rate=2, burst=10, queue_timeout=30.0),
+    "bulk": RouteClass("bulk", 3, max_concurrent=2, max_queue=4, rate=0.2, burst=2, queue_timeout=30.0),
+}
+
+LIMIT_TYPES = {"max_concurrent": int, "max_queue": int, "rate": float, "burst": int, "queue_timeout": float}
+
+for route_class in ROUTE_CLASSES.values():
+    for limit, cast in LIMIT_TYPES.items():
+        value = os.environ.get(f"ADMISSION_{route_class.name.upper()}_{limit.upper()}")
+        if value:
+            setattr(route_class, limit, cast(value))
+
+# Worker-wide concurrency shared by all classes
+GLOBAL_MAX_CONCURRENT = int(os.environ.get("ADMISSION_GLOBAL_MAX_CONCURRENT", "32"))
+GLOBAL_MAX_QUEUE = int(os.environ.get("ADMISSION_GLOBAL_MAX_QUEUE", "512"))
+
+ADMISSION_ENABLED = os.environ.get("ADMISSION_ENABLED", "1").lower() not in ("0", "false", "no", "off")
+
+API_KEYS = frozenset(key.strip() for key in os.environ.get("ADMISSION_API_KEYS", "").split(",") if key.strip())
+
+# Paths that must never be shed
+EXEMPT_PATHS = ("/api/health/", "/api/admission/")
+
+
+def classify_request(method: str, path: str, query_string: bytes) -> Optional[str]:
+    if not path.startswith("/api/") or path.startswith(EXEMPT_PATHS):
+        return None
+    if path.startswith("/api/vendors/export/") or path == "/api/vendors/batch":
+        return "bulk"
+    # Creating an export job starts a full render
+    if method == "POST" and path == "/api/vendors/exports":
+        return "bulk"
+    if path.startswith("/api/vendors/exports/") and path.endswith("/download"):
+        return "download"
+    if path == "/api/vendors/stats":
+        return "stats"
+    if method == "GET" and path == "/api/vendors" and parse_qs(query_string.decode("latin-1")).get("search"):
+        return "search"
+    return "interactive"
+
+
+class Shed(Exception):
+    def __init__(self, status_code: int, detail: str, retry_after: float):
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        # Returns 0 when a token was taken, otherwise seconds until one is available
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    def __init__(self, max_clients: int = 10000):
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()
+
+    def check(self, client_key: str, route_class: RouteClass):
+        key = (client_key, route_class.name)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(route_class.rate, route_class.burst)
+            self.buckets[key] = bucket
+            # Forget the least recently seen clients
+            while len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+        wait = bucket.take()
+        if wait:
+            raise Shed(429, "Rate limit exceeded", wait)
+
+
+class PriorityGate:
+    def __init__(self, max_concurrent: int, max_queue: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.waiters = []
+        self.counter = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future in self.waiters if not future.done())
+
+    async def acquire(self, priority: int, timeout: float):
+        if self.in_flight < self.max_concurrent and not self.queued:
+            self.in_flight += 1
+            return
+        if self.queued >= self.max_queue:
+            raise Shed(503, "Server busy, queue full", timeout)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                future.cancel()
+            raise Shed(503, "Server busy, timed out in queue", timeout)
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+            raise
+
+    def release(self):
+        # Hand the slot straight to the best waiter so it cannot be stolen
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class AdmissionStats:
+    def __init__(self):
+        self.admitted = 0
+        self.rate_limited = 0
+        self.queue_full = 0
+        self.timed_out = 0
+
+    def record_shed(self, shed: Shed):
+        if shed.status_code == 429:
+            self.rate_limited += 1
+        elif "timed out" in shed.detail:
+            self.timed_out += 1
+        else:
+            self.queue_full += 1
+
+
+class AdmissionController:
+    def __init__(self, route_classes: dict = None, global_max_concurrent: int = GLOBAL_MAX_CONCURRENT,
+                 global_max_queue: int = GLOBAL_MAX_QUEUE):
+        self.route_classes = route_classes or ROUTE_CLASSES
+        self.rate_limiter = RateLimiter()
+        self.gates = {
+            name: PriorityGate(rc.max_concurrent, rc.max_queue)
+            for name, rc in self.route_classes.items()
+        }
+        self.global_gate = PriorityGate(global_max_concurrent, global_max_queue)
+        self.stats = {name: AdmissionStats() for name in self.route_classes}
+
+    async def admit(self, class_name: str, client_key: str):
+        route_class = self.route_classes[class_name]
+        stats = self.stats[class_name]
+        gate = self.gates[class_name]
+        try:
+            self.rate_limiter.check(client_key, route_class)
+            await gate.acquire(route_class.priority, route_class.queue_timeout)
+            try:
+                await self.global_gate.acquire(route_class.priority, route_class.queue_timeout)
+            except BaseException:
+                gate.release()
+                raise
+        except Shed as shed:
+            stats.record_shed(shed)
+            raise
+        stats.admitted += 1
+
+    def release(self, class_name: str):
+        self.global_gate.release()
+        self.gates[class_name].release()
+
+    def snapshot(self) -> dict:
+        return {
+            "global": {
+                "in_flight": self.global_gate.in_flight,
+                "queued": self.global_gate.queued,
+                "max_concurrent": self.global_gate.max_concurrent
+            },
+            "classes": {
+                name: {
+                    "priority": rc.priority,
+                    "in_flight": self.gates[name].in_flight,
+                    "queued": self.gates[name].queued,
+                    "max_concurrent": rc.max_concurrent,
+                    "max_queue": rc.max_queue,
+                    "admitted": self.stats[name].admitted,
+                    "shed_rate_limited": self.stats[name].rate_limited,
+                    "shed_queue_full": self.stats[name].queue_full,
+                    "shed_timed_out": self.stats[name].timed_out
+                }
+                for name, rc in self.route_classes.items()
+            }
+        }
+
+
+def client_key_from_scope(scope, api_keys: frozenset = API_KEYS) -> str:
+    for name, value in scope.get("headers", []):
+        if name == b"x-api-key" and value:
+            key = value.decode("latin-1")
+            if key in api_keys:
+                return "key:" + key
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class AdmissionMiddleware:
+    # Plain ASGI middleware so slots are held until streamed responses finish
+
+    def __init__(self, app, controller: AdmissionController, api_keys: frozenset = API_KEYS):
+        self.app = app
+        self.controller = controller
+        self.api_keys = api_keys
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        class_name = classify_request(scope["method"], scope["path"], scope.get("query_string", b""))
+        if class_name is None:
+            return await self.app(scope, receive, send)
+
+        try:
+            await self.controller.admit(class_name, client_key_from_scope(scope, self.api_keys))
+        except Shed as shed:
+            return await self.send_shed(send, shed)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(class_name)
+
+    async def send_shed(self, send, shed: Shed):
+        body = json.dumps({"detail": shed.detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": shed.status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(shed.retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
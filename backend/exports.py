@@ -0,0 +1,291 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Background export jobs
+#
+# A job snapshots the vendor filter, is rendered to a CSV file on local disk
+# by a thread pool in chunks (progress is written to the store after every
+# chunk), and the finished file is served with HTTP Range support. Job state
+# lives in the store so any worker process on the host can report on or
+# serve a job another worker rendered.
+#
+# Every chunk also stamps progress_at on the rendering job and on the jobs
+# queued behind it in the same worker. An unfinished job whose heartbeat is
+# older than EXPORT_STALE_SECONDS belonged to a worker that died; it is
+# reported as failed and no longer reused, so asking again starts a new job.
+
+CSV_HEADERS = [
+    'Vendor ID', 'Company Name', 'Contact Person', 'Email', 'Phone',
+    'Street Address', 'City', 'Postal Code', 'Country',
+    'Bank Name', 'Account Number', 'IBAN', 'BIC', 'Status',
+    'Created At', 'Updated At'
+]
+
+EXPORT_DIR = Path(os.environ.get('EXPORT_DIR', Path(__file__).parent / 'exports'))
+EXPORT_WORKERS = int(os.environ.get('EXPORT_WORKERS', '2'))
+EXPORT_CHUNK_SIZE = 1000
+# Identical exports requested within this window reuse the same job/file
+EXPORT_DEDUP_SECONDS = int(os.environ.get('EXPORT_DEDUP_SECONDS', '300'))
+# Finished export files are deleted after this long
+EXPORT_RETENTION_SECONDS = int(os.environ.get('EXPORT_RETENTION_SECONDS', '86400'))
+# Unfinished (queued or rendering) jobs per worker, and per client
+EXPORT_MAX_PENDING = int(os.environ.get('EXPORT_MAX_PENDING', '16'))
+EXPORT_MAX_PENDING_PER_CLIENT = int(os.environ.get('EXPORT_MAX_PENDING_PER_CLIENT', '2'))
+# Unfinished jobs without a heartbeat for this long are treated as failed
+EXPORT_STALE_SECONDS = int(os.environ.get('EXPORT_STALE_SECONDS', '300'))
+# Suggested wait before asking again once a limit is hit
+EXPORT_RETRY_AFTER_SECONDS = 10
+
+ACTIVE_STATUSES = ("pending", "running", "completed")
+UNFINISHED_STATUSES = ("pending", "running")
+
+
+class ExportLimitExceeded(Exception):
+    # 429 when the client has too many unfinished jobs, 503 when the worker has
+    def __init__(self, status_code: int, detail: str):
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = EXPORT_RETRY_AFTER_SECONDS
+
+
+def vendor_csv_row(vendor: dict) -> list:
+    return [
+        vendor.get('vendor_id', ''),
+        vendor.get('company_name', ''),
+        vendor.get('contact_person', ''),
+        vendor.get('email', ''),
+        vendor.get('phone', ''),
+        vendor.get('street_address', ''),
+        vendor.get('city', ''),
+        vendor.get('postal_code', ''),
+        vendor.get('country', ''),
+        vendor.get('bank_name', ''),
+        vendor.get('account_number', ''),
+        vendor.get('iban', ''),
+        vendor.get('bic', ''),
+        vendor.get('status', ''),
+        vendor.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if vendor.get('created_at') else '',
+        vendor.get('updated_at', '').strftime('%Y-%m-%d %H:%M:%S') if vendor.get('updated_at') else ''
+    ]
+
+
+def filter_hash(filters: dict) -> str:
+    # Canonical form: unset filters dropped, keys sorted
+    canonical = {k: v for k, v in sorted(filters.items()) if v not in (None, "")}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[tuple]:
+    # Single "bytes=start-end" range -> (start, end) inclusive. Returns None for
+    # no/unsupported header, raises ValueError when unsatisfiable.
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec:
+        return None
+    start_text, _, end_text = spec.partition("-")
+    if start_text:
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    elif end_text:
+        # Suffix range: last N bytes
+        start = max(0, size - int(end_text))
+        end = size - 1
+    else:
+        raise ValueError("Invalid range")
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def iter_csv_chunks(vendors, chunk_bytes: int = 64 * 1024):
+    # CSV text for `vendors` in pieces of roughly `chunk_bytes`, header first
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADERS)
+    for vendor in vendors:
+        writer.writerow(vendor_csv_row(vendor))
+        if buffer.tell() >= chunk_bytes:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_file_range(path: Path, start: int, end: int, chunk_size: int = 64 * 1024):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+
+class ExportJobManager:
+    def __init__(self, store, export_dir: Path = EXPORT_DIR, workers: int = EXPORT_WORKERS,
+                 max_pending: int = EXPORT_MAX_PENDING,
+                 max_pending_per_client: int = EXPORT_MAX_PENDING_PER_CLIENT,
+                 stale_seconds: int = EXPORT_STALE_SECONDS):
+        self.store = store
+        self.export_dir = Path(export_dir)
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+        self.stopping = threading.Event()
+        self.futures = {}
+        # The executor's queue is unbounded, so admission is capped here:
+        # {job_id: client_key} of jobs submitted and not yet finished
+        self.max_pending = max_pending
+        self.max_pending_per_client = max_pending_per_client
+        self.pending = {}
+        self.stale_seconds = stale_seconds
+        # Request handlers run in a thread pool; serializes dedup and submission
+        self.lock = threading.Lock()
+
+    def file_path(self, job_id: str) -> Path:
+        return self.export_dir / f"{job_id}.csv"
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        job = self.store.get_export_job(job_id)
+        return self.fail_if_stale(job) if job else None
+
+    def find_recent(self, digest: str) -> Optional[dict]:
+        since = datetime.utcnow() - timedelta(seconds=EXPORT_DEDUP_SECONDS)
+        for job in self.store.find_export_jobs(digest, list(ACTIVE_STATUSES), since):
+            job = self.fail_if_stale(job)
+            if job["status"] in UNFINISHED_STATUSES:
+                return job
+            if job["status"] == "completed" and self.file_path(job["job_id"]).exists():
+                return job
+        return None
+
+    def fail_if_stale(self, job: dict) -> dict:
+        # Marks an unfinished job whose worker stopped heartbeating as failed
+        if job["status"] not in UNFINISHED_STATUSES or job["job_id"] in self.pending:
+            return job
+        heartbeat = job.get("progress_at") or job["created_at"]
+        if heartbeat >= datetime.utcnow() - timedelta(seconds=self.stale_seconds):
+            return job
+        fields = {"status": "failed", "error": "Export worker stopped responding", "completed_at": datetime.utcnow()}
+        self.store.update_export_job(job["job_id"], fields)
+        return {**job, **fields}
+
+    def create_job(self, filters: dict, client_key: str = "") -> tuple:
+        # `filters` as accepted by the store (dates already parsed)
+        # Returns (job, reused); raises ExportLimitExceeded
+        self.purge_expired()
+        digest = filter_hash(filters)
+        with self.lock:
+            existing = self.find_recent(digest)
+            if existing:
+                return existing, True
+            self.check_limits(client_key)
+            return self.submit_job(digest, filters, client_key), False
+
+    def check_limits(self, client_key: str):
+        if sum(1 for key in self.pending.values() if key == client_key) >= self.max_pending_per_client:
+            raise ExportLimitExceeded(429, "Too many unfinished exports for this client")
+        if len(self.pending) >= self.max_pending:
+            raise ExportLimitExceeded(503, "Export queue full")
+
+    def submit_job(self, digest: str, filters: dict, client_key: str) -> dict:
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "filter": {k: v for k, v in filters.items() if v is not None},
+            "filter_hash": digest,
+            "status": "pending",
+            "processed": 0,
+            "total": None,
+            "size": None,
+            "error": None,
+            "created_at": datetime.utcnow(),
+            "progress_at": None,
+            "started_at": None,
+            "completed_at": None
+        }
+        self.store.insert_export_job(job)
+        self.pending[job["job_id"]] = client_key
+        self.futures[job["job_id"]] = self.executor.submit(self.render, job["job_id"], filters)
+        return job
+
+    def render(self, job_id: str, filters: dict):
+        with self.lock:
+            self.futures.pop(job_id, None)
+        try:
+            self.render_file(job_id, filters)
+        finally:
+            with self.lock:
+                self.pending.pop(job_id, None)
+
+    def render_file(self, job_id: str, filters: dict):
+        final_path = self.file_path(job_id)
+        part_path = final_path.with_suffix(".csv.part")
+        try:
+            total = self.store.count_vendors(filters)
+            now = datetime.utcnow()
+            self.store.update_export_job(
+                job_id, {"status": "running", "total": total, "started_at": now, "progress_at": now}
+            )
+            processed = 0
+            with open(part_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADERS)
+                rows = []
+                for vendor in self.store.iter_vendors(filters, batch_size=EXPORT_CHUNK_SIZE):
+                    rows.append(vendor_csv_row(vendor))
+                    if len(rows) == EXPORT_CHUNK_SIZE:
+                        processed = self.flush(job_id, writer, rows, processed)
+                        rows = []
+                        if self.stopping.is_set():
+                            raise RuntimeError("Export interrupted by shutdown")
+                processed = self.flush(job_id, writer, rows, processed)
+            os.replace(part_path, final_path)
+            self.store.update_export_job(job_id, {
+                "status": "completed",
+                "size": final_path.stat().st_size,
+                "completed_at": datetime.utcnow()
+            })
+        except Exception as e:
+            part_path.unlink(missing_ok=True)
+            self.store.update_export_job(
+                job_id, {"status": "failed", "error": str(e), "completed_at": datetime.utcnow()}
+            )
+
+    def flush(self, job_id: str, writer, rows: list, processed: int) -> int:
+        writer.writerows(rows)
+        processed += len(rows)
+        now = datetime.utcnow()
+        self.store.update_export_job(job_id, {"processed": processed, "progress_at": now})
+        # Jobs still queued in this worker are alive too
+        with self.lock:
+            queued = list(self.futures)
+        if queued:
+            self.store.update_export_jobs(queued, {"progress_at": now})
+        return processed
+
+    def purge_expired(self):
+        cutoff = datetime.utcnow() - timedelta(seconds=EXPORT_RETENTION_SECONDS)
+        for job_id in self.store.expire_export_jobs(cutoff):
+            self.file_path(job_id).unlink(missing_ok=True)
+
+    def shutdown(self):
+        # Running jobs stop at their next chunk boundary and are marked failed
+        self.stopping.set()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        cancelled = [job_id for job_id, future in self.futures.items() if future.cancelled()]
+        if cancelled:
+            self.store.update_export_jobs(
+                cancelled, {"status": "failed", "error": "Export cancelled by shutdown"}
+            )
@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import Optional
+
+# Vendor change history
+#
+# Every mutation of a vendor appends one change entry holding a field-level
+# diff ({field: [old, new]}) and a per-vendor sequence number taken from the
+# vendor's own `history_seq` field. Full snapshots of the vendor are written
+# every SNAPSHOT_INTERVAL changes so that point-in-time reads only replay a
+# bounded number of diffs.
+#
+# A mutation's change entry and snapshots travel as one history record
+# ({"seq", "change", "snapshots"}) that the store writes in the same atomic
+# operation as the vendor itself, so the log cannot miss a change. Updates are
+# optimistic: the diff is computed against the vendor as read, and the store
+# only applies it while `history_seq` is still the one that was read.
+
+SNAPSHOT_INTERVAL = 50
+
+# Attempts at a single-vendor update that keeps losing to concurrent writers
+UPDATE_ATTEMPTS = 5
+
+# Bookkeeping fields that are not part of the audited vendor state
+UNTRACKED_FIELDS = {"_id", "history_seq"}
+
+
+class ConcurrentUpdateError(Exception):
+    pass
+
+
+def compute_diff(before: dict, after: dict) -> dict:
+    # Compact field-level diff: only fields whose value changed are kept
+    changes = {}
+    for field in set(before) | set(after):
+        if field in UNTRACKED_FIELDS:
+            continue
+        old = before.get(field)
+        new = after.get(field)
+        if old != new:
+            changes[field] = [old, new]
+    return changes
+
+
+def apply_diff(state: dict, changes: dict) -> dict:
+    # Replay a diff forward onto a vendor state
+    state = dict(state)
+    for field, (_, new) in changes.items():
+        if new is None:
+            state.pop(field, None)
+        else:
+            state[field] = new
+    return state
+
+
+def strip_untracked(vendor: dict) -> dict:
+    return {k: v for k, v in vendor.items() if k not in UNTRACKED_FIELDS}
+
+
+def build_snapshot(vendor_id: str, seq: int, state: dict, taken_at: datetime) -> dict:
+    return {"vendor_id": vendor_id, "seq": seq, "state": strip_untracked(state), "taken_at": taken_at}
+
+
+def build_creation_record(vendor: dict) -> dict:
+    return {
+        "seq": 0,
+        "change": None,
+        "snapshots": [build_snapshot(vendor["vendor_id"], 0, vendor, vendor["created_at"])]
+    }
+
+
+def build_change_entry(before: dict, after: dict, action: str = "update") -> Optional[dict]:
+    changes = compute_diff(before, after)
+    if not changes:
+        return None
+    return {
+        "vendor_id": after["vendor_id"],
+        "seq": after["history_seq"],
+        "action": action,
+        "changes": changes,
+        "changed_at": after.get("updated_at") or datetime.utcnow()
+    }
+
+
+def build_change_record(before: dict, after: dict, action: str = "update") -> Optional[dict]:
+    # `before` and `after` are the vendor documents around an update that
+    # increments `history_seq`; `after["history_seq"]` is this change's sequence
+    entry = build_change_entry(before, after, action)
+    if entry is None:
+        return None
+    vendor_id = entry["vendor_id"]
+    seq = entry["seq"]
+    snapshots = []
+    # Vendors created before history tracking have no base snapshot yet
+    if seq == 1:
+        snapshots.append(build_snapshot(vendor_id, 0, before, before.get("created_at") or entry["changed_at"]))
+    if seq % SNAPSHOT_INTERVAL == 0:
+        snapshots.append(build_snapshot(vendor_id, seq, after, entry["changed_at"]))
+    return {"seq": seq, "change": entry, "snapshots": snapshots}
+
+
+def next_state(vendor: dict, fields: dict) -> dict:
+    return {**vendor, **fields, "history_seq": (vendor.get("history_seq") or 0) + 1}
+
+
+def create_vendor_with_history(store, vendor: dict):
+    store.insert_vendor(vendor, build_creation_record(vendor))
+
+
+def update_vendors_with_history(store, vendors: dict, fields: dict, action: str = "update") -> dict:
+    # Apply `fields` to the vendors read as {vendor_id: vendor}, each only if
+    # nobody changed it since. Returns {vendor_id: updated vendor} for the
+    # vendors that were updated.
+    after = {vendor_id: next_state(vendor, fields) for vendor_id, vendor in vendors.items()}
+    records = {}
+    for vendor_id, vendor in vendors.items():
+        record = build_change_record(vendor, after[vendor_id], action)
+        if record is not None:
+            records[vendor_id] = record
+    applied = store.bulk_update_vendors(
+        {vendor_id: vendor.get("history_seq") for vendor_id, vendor in vendors.items()},
+        fields,
+        records
+    )
+    return {vendor_id: after[vendor_id] for vendor_id in applied}
+
+
+def update_vendor_with_history(store, vendor_id: str, fields: dict, action: str = "update") -> Optional[tuple]:
+    # Returns (before, after), or None when there is no such live vendor
+    for _ in range(UPDATE_ATTEMPTS):
+        vendor = store.get_vendor(vendor_id)
+        if vendor is None:
+            return None
+        updated = update_vendors_with_history(store, {vendor_id: vendor}, fields, action)
+        if vendor_id in updated:
+            return vendor, updated[vendor_id]
+    raise ConcurrentUpdateError(f"{vendor_id} kept changing during the update")
+
+
+def get_history(store, vendor_id: str, limit: int = 100, offset: int = 0) -> list:
+    return store.list_changes(vendor_id, limit=limit, offset=offset)
+
+
+def get_vendor_as_of(store, vendor_id: str, as_of: datetime) -> Optional[dict]:
+    # Start from the newest snapshot taken at or before `as_of`, then replay
+    # the (at most SNAPSHOT_INTERVAL) diffs recorded after it up to `as_of`
+    snapshot = store.latest_snapshot(vendor_id, as_of)
+    if snapshot is None:
+        return None
+
+    state = snapshot["state"]
+    for entry in store.changes_after(vendor_id, snapshot["seq"], as_of):
+        state = apply_diff(state, entry["changes"])
+
+    if state.get("is_deleted"):
+        return None
+    return state
@@ -0,0 +1,130 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Vendor list/search result cache
+#
+# Results of `get_vendors` are cached under a canonical form of the request
+# (normalized search term, filters with unset values dropped, sorted keys,
+# pagination). Every entry is stamped with the collection write version; the
+# mutation endpoints bump that version, which invalidates all entries at once.
+# The version is kept in a store counter so other worker processes notice
+# writes too: each worker re-reads it at most every
+# VERSION_CHECK_SECONDS, so a cache hit normally never touches Mongo.
+# Handlers run in a thread pool, so every operation holds `lock`.
+
+QUERY_CACHE_MAX_BYTES = int(os.environ.get('QUERY_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+VERSION_CHECK_SECONDS = float(os.environ.get('QUERY_CACHE_VERSION_CHECK_SECONDS', '1.0'))
+VERSION_COUNTER_ID = "vendor_write_version"
+
+
+def normalize_search(search: Optional[str]) -> Optional[str]:
+    if search is None:
+        return None
+    search = search.strip()
+    if not search:
+        return None
+    # Search is a literal, case-insensitive substring match
+    return search.lower()
+
+
+def canonical_key(params: dict) -> str:
+    canonical = {k: v for k, v in params.items() if v not in (None, "")}
+    return json.dumps(canonical, sort_keys=True, default=str)
+
+
+def approx_size(value) -> int:
+    # Rough byte count of a JSON-like result, good enough for a memory bound
+    if isinstance(value, dict):
+        return 64 + sum(len(str(k)) + approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(approx_size(v) for v in value)
+    if isinstance(value, str):
+        return 49 + len(value)
+    return 32
+
+
+class QueryCache:
+    def __init__(self, store=None, max_bytes: int = QUERY_CACHE_MAX_BYTES):
+        self.store = store
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (version, size, value)
+        self.bytes = 0
+        self.version = 0
+        self.version_checked = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def current_version(self) -> int:
+        with self.lock:
+            now = time.monotonic()
+            if self.store is not None and now - self.version_checked >= VERSION_CHECK_SECONDS:
+                self.version = self.store.peek_sequence(VERSION_COUNTER_ID)
+                self.version_checked = now
+            return self.version
+
+    def bump(self):
+        # Called once per mutation (or once per batch mutation)
+        with self.lock:
+            if self.store is not None:
+                self.version = self.store.next_sequence(VERSION_COUNTER_ID)
+                self.version_checked = time.monotonic()
+            else:
+                self.version += 1
+            self.clear()
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == self.current_version():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                self.drop(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value, version: int):
+        # `version` must be read before the query ran so a concurrent write
+        # can never be hidden behind a fresh-looking entry
+        size = approx_size(value)
+        with self.lock:
+            if size > self.max_bytes or version != self.version:
+                return
+            if key in self.entries:
+                self.drop(key)
+            self.entries[key] = (version, size, value)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self.drop(oldest)
+                self.evictions += 1
+
+    def drop(self, key: str):
+        _, size, _ = self.entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "write_version": self.version
+            }
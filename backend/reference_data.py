@@ -0,0 +1,289 @@
+import bisect
+import csv
+import os
+import re
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+# Bank reference data
+#
+# Two files are loaded into memory per worker: a bank directory (BIC -> bank
+# name; the country is the BIC's country code) and the per-country IBAN
+# formats from the IBAN registry (all of its countries are listed in
+# reference/iban_formats.csv). The directory is packed into flat sorted
+# structures rather than a dict of dicts so a full BIC directory stays small:
+# every BIC is 11 characters in one fixed-width string searched by bisection,
+# and bank names are stored once and referenced by index. Bank name
+# autocomplete bisects a sorted list of name words.
+#
+# The loader re-checks the files' modification times at most every
+# RELOAD_CHECK_SECONDS and swaps in a freshly built snapshot when they
+# change, so the directory can be replaced without restarting workers. The
+# check and the re-parse run in a background thread: current() is called
+# from async handlers and request validators on the event loop, and keeps
+# returning the previous snapshot until the new one is assigned. A file that
+# fails to parse leaves the previous snapshot in place.
+#
+# Without a bank directory file BICs are only shape-checked; once one is
+# present, BICs it does not list are rejected and bank names are taken from
+# it. reference/bank_directory.sample.csv shows the format.
+
+REFERENCE_DIR = Path(__file__).parent / 'reference'
+BANK_DIRECTORY_PATH = Path(os.environ.get('BANK_DIRECTORY_PATH', REFERENCE_DIR / 'bank_directory.csv'))
+IBAN_FORMATS_PATH = Path(os.environ.get('IBAN_FORMATS_PATH', REFERENCE_DIR / 'iban_formats.csv'))
+RELOAD_CHECK_SECONDS = float(os.environ.get('REFERENCE_RELOAD_CHECK_SECONDS', '5.0'))
+
+BIC_LENGTH = 11
+BIC_PATTERN = re.compile(r'^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$')
+IBAN_PATTERN = re.compile(r'^[A-Z]{2}[0-9]{2}[A-Z0-9]{11,30}$')
+WORD_PATTERN = re.compile(r'\w+')
+
+# IBAN registry BBAN notation: n digits, a upper case letters, c alphanumerics
+BBAN_CHARSETS = {'n': '[0-9]', 'a': '[A-Z]', 'c': '[A-Z0-9]'}
+
+
+def normalize_bic(bic: str) -> str:
+    # 8 character BICs address the head office, same as the 'XXX' branch code
+    bic = bic.strip().upper()
+    return bic + 'XXX' if len(bic) == 8 else bic
+
+
+def normalize_iban(iban: str) -> str:
+    return iban.replace(' ', '').upper()
+
+
+def compile_bban_format(bban_format: str):
+    # "8n10n" -> (18, regex matching the BBAN)
+    parts = re.findall(r'(\d+)([nac])', bban_format)
+    if not parts or ''.join(f'{n}{t}' for n, t in parts) != bban_format:
+        raise ValueError(f'Invalid BBAN format: {bban_format!r}')
+    length = sum(int(n) for n, _ in parts)
+    pattern = ''.join(f'{BBAN_CHARSETS[t]}{{{n}}}' for n, t in parts)
+    return length, re.compile(f'^{pattern}$')
+
+
+def iban_checksum_ok(iban: str) -> bool:
+    # ISO 13616 mod 97: move the first four characters to the end, map letters to 10..35
+    rearranged = iban[4:] + iban[:4]
+    return int(''.join(str(int(ch, 36)) for ch in rearranged)) % 97 == 1
+
+
+def validate_iban(iban: str, iban_formats: Optional[dict] = None) -> Optional[str]:
+    # Returns an error message, or None when the IBAN is valid. Countries
+    # missing from the registry data (new IBAN countries, or no data at all)
+    # only get the shape and checksum checks.
+    iban = normalize_iban(iban)
+    if not IBAN_PATTERN.match(iban):
+        return 'Invalid IBAN format'
+    entry = (iban_formats or {}).get(iban[:2])
+    if entry is not None:
+        length, bban = entry
+        if len(iban) != length:
+            return f'IBAN for {iban[:2]} must be {length} characters'
+        if not bban.match(iban[4:]):
+            return f'Invalid IBAN format for {iban[:2]}'
+    if not iban_checksum_ok(iban):
+        return 'Invalid IBAN check digits'
+    return None
+
+
+def load_iban_formats(path: Path) -> dict:
+    # CSV columns: country_code,length,bban_format
+    formats = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            country = row['country_code'].strip().upper()
+            length = int(row['length'])
+            bban_length, bban = compile_bban_format(row['bban_format'].strip())
+            if bban_length + 4 != length:
+                raise ValueError(f'IBAN length for {country} does not match its BBAN format')
+            formats[country] = (length, bban)
+    return formats
+
+
+class BankEntry:
+    __slots__ = ('bic', 'bank_name', 'country_code')
+
+    def __init__(self, bic: str, bank_name: str):
+        self.bic = bic
+        self.bank_name = bank_name
+        self.country_code = bic[4:6]
+
+    def to_dict(self) -> dict:
+        return {'bic': self.bic, 'bank_name': self.bank_name, 'country_code': self.country_code}
+
+
+class BankDirectory:
+    def __init__(self, rows):
+        # rows: iterable of (bic, bank_name); later duplicates win
+        by_bic = {}
+        for bic, bank_name in rows:
+            bic = normalize_bic(bic)
+            if not BIC_PATTERN.match(bic):
+                raise ValueError(f'Invalid BIC in bank directory: {bic!r}')
+            by_bic[bic] = ' '.join(bank_name.split())
+
+        names = sorted(set(by_bic.values()))
+        name_index = {name: i for i, name in enumerate(names)}
+        bics = sorted(by_bic)
+        self.names = names
+        self.bics = ''.join(bics)
+        self.bic_names = array('I', (name_index[by_bic[bic]] for bic in bics))
+
+        # Representative BIC per name: its first head office ('XXX'), or its
+        # first BIC when the directory only lists branches
+        representative = {}
+        for position, bic in enumerate(bics):
+            name_id = self.bic_names[position]
+            current = representative.get(name_id)
+            if current is None or (bic.endswith('XXX') and not bics[current].endswith('XXX')):
+                representative[name_id] = position
+        self.name_bics = array('I', (representative[name_id] for name_id in range(len(names))))
+
+        # (word, name id) pairs sorted by word for prefix search
+        words = sorted(
+            (word, name_id)
+            for name_id, name in enumerate(names)
+            for word in set(WORD_PATTERN.findall(name.lower()))
+        )
+        self.words = [word for word, _ in words]
+        self.word_names = array('I', (name_id for _, name_id in words))
+
+    def __len__(self) -> int:
+        return len(self.bic_names)
+
+    def bic_at(self, position: int) -> str:
+        return self.bics[position * BIC_LENGTH:(position + 1) * BIC_LENGTH]
+
+    def find_position(self, bic: str) -> int:
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.bic_at(mid) < bic:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < len(self) and self.bic_at(lo) == bic else -1
+
+    def lookup(self, bic: str) -> Optional[BankEntry]:
+        bic = normalize_bic(bic)
+        position = self.find_position(bic)
+        if position < 0 and not bic.endswith('XXX'):
+            # Branch codes missing from the directory fall back to the head office
+            position = self.find_position(bic[:8] + 'XXX')
+        if position < 0:
+            return None
+        return BankEntry(self.bic_at(position), self.names[self.bic_names[position]])
+
+    def autocomplete(self, query: str, country_code: Optional[str] = None, limit: int = 10) -> List[BankEntry]:
+        # Every word of the query must prefix some word of the bank name.
+        # Candidates come from the longest query word, in word then name order.
+        terms = WORD_PATTERN.findall(query.lower())
+        if not terms:
+            return []
+        anchor = max(terms, key=len)
+        start = bisect.bisect_left(self.words, anchor)
+        results = []
+        seen = set()
+        for position in range(start, len(self.words)):
+            if not self.words[position].startswith(anchor):
+                break
+            name_id = self.word_names[position]
+            if name_id in seen:
+                continue
+            seen.add(name_id)
+            name = self.names[name_id]
+            bic = self.bic_at(self.name_bics[name_id])
+            if country_code and bic[4:6] != country_code.upper():
+                continue
+            name_words = WORD_PATTERN.findall(name.lower())
+            if all(any(word.startswith(term) for word in name_words) for term in terms):
+                results.append(BankEntry(bic, name))
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def load_bank_directory(path: Path) -> BankDirectory:
+    # CSV columns: bic,bank_name
+    with open(path, newline='', encoding='utf-8') as f:
+        return BankDirectory((row['bic'], row['bank_name']) for row in csv.DictReader(f))
+
+
+class ReferenceData:
+    # One immutable snapshot of both files
+    def __init__(self, banks: BankDirectory, iban_formats: dict, loaded_at: datetime):
+        self.banks = banks
+        self.iban_formats = iban_formats
+        self.loaded_at = loaded_at
+
+
+class ReferenceDataLoader:
+    def __init__(self, bank_directory_path: Path = BANK_DIRECTORY_PATH,
+                 iban_formats_path: Path = IBAN_FORMATS_PATH):
+        self.paths = (Path(bank_directory_path), Path(iban_formats_path))
+        self.mtimes = None
+        self.data = ReferenceData(BankDirectory([]), {}, datetime.utcnow())
+        self.checked = 0.0
+        self.reloads = 0
+        self.last_error = None
+        self.lock = threading.Lock()
+        self.reload_thread = None
+        self.reload()
+        if self.last_error:
+            # Refuse to start on a broken file; later reloads keep the old data
+            raise ValueError(f'Could not load reference data: {self.last_error}')
+
+    def file_mtimes(self) -> tuple:
+        return tuple(path.stat().st_mtime_ns if path.exists() else None for path in self.paths)
+
+    def reload(self):
+        mtimes = self.file_mtimes()
+        bank_path, iban_path = self.paths
+        try:
+            # A missing file means no data of that kind (shape checks only)
+            banks = load_bank_directory(bank_path) if mtimes[0] is not None else BankDirectory([])
+            iban_formats = load_iban_formats(iban_path) if mtimes[1] is not None else {}
+        except (OSError, KeyError, ValueError) as e:
+            self.last_error = f'{type(e).__name__}: {e}'
+        else:
+            self.data = ReferenceData(banks, iban_formats, datetime.utcnow())
+            self.reloads += 1
+            self.last_error = None
+        # Remember the mtimes even on failure so a broken file is not re-parsed
+        # on every check; fixing it changes the mtime again
+        self.mtimes = mtimes
+        self.checked = time.monotonic()
+
+    def reload_if_changed(self):
+        if self.file_mtimes() != self.mtimes:
+            self.reload()
+
+    def current(self) -> ReferenceData:
+        if time.monotonic() - self.checked >= RELOAD_CHECK_SECONDS:
+            with self.lock:
+                running = self.reload_thread is not None and self.reload_thread.is_alive()
+                if not running and time.monotonic() - self.checked >= RELOAD_CHECK_SECONDS:
+                    self.checked = time.monotonic()
+                    self.reload_thread = threading.Thread(
+                        target=self.reload_if_changed, name="reference-reload", daemon=True
+                    )
+                    self.reload_thread.start()
+        return self.data
+
+    def stats(self) -> dict:
+        data = self.data
+        return {
+            "bank_directory": str(self.paths[0]),
+            "iban_formats": str(self.paths[1]),
+            "banks": len(data.banks),
+            "bank_names": len(data.banks.names),
+            "iban_countries": len(data.iban_formats),
+            "loaded_at": data.loaded_at,
+            "reloads": self.reloads,
+            "last_error": self.last_error
+        }
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Production launcher for the Vendor Management System API.
+
+Runs N uvicorn worker processes. Workers import `server:app` themselves after
+being spawned, and open their Mongo clients in the app's lifespan hook, so no
+client or pool state is shared across processes. On SIGTERM/SIGINT each worker
+stops accepting connections and drains in-flight requests for up to
+GRACEFUL_TIMEOUT seconds before closing its client.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import uvicorn
+
+BACKEND_DIR = Path(__file__).parent
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the vendor API with multiple workers")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8001")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        help="Number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=int(os.environ.get("GRACEFUL_TIMEOUT", "30")),
+        help="Seconds to drain in-flight requests on shutdown"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    uvicorn.run(
+        "server:app",
+        app_dir=str(BACKEND_DIR),
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        lifespan="on",
+        timeout_graceful_shutdown=args.graceful_timeout
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,126 +1,79 @@
-<<<<<<< HEAD
-from fastapi import FastAPI, APIRouter
-from dotenv import load_dotenv
-from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
-import os
-import logging
-from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List
-import uuid
-from datetime import datetime
-
-
-ROOT_DIR = Path(__file__).parent
-load_dotenv(ROOT_DIR / '.env')
-
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
-
-# Create the main app without a prefix
-app = FastAPI()
-
-# Create a router with the /api prefix
-api_router = APIRouter(prefix="/api")
-
-
-# Define Models
-class StatusCheck(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-
-class StatusCheckCreate(BaseModel):
-    client_name: str
-
-# Add your routes to the router instead of directly to app
-@api_router.get("/")
-async def root():
-    return {"message": "Hello World"}
-
-@api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
-    return status_obj
-
-@api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
-
-# Include the router in the main app
-app.include_router(api_router)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
-=======
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, EmailStr, validator
 from typing import Optional, List
 import os
 import uuid
-from datetime import datetime
-import pymongo
-from pymongo import MongoClient
-import csv
-import io
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 import re
 
-app = FastAPI()
+# Keep module import cheap: every worker spawn pays for it. Heavy optional
+# dependencies (pandas, numpy, boto3) belong inside the export/import code
+# paths that use them, and DB bootstrap belongs in `lifespan`.
+# tests/test_startup.py enforces both.
+
+from admission import ADMISSION_ENABLED, AdmissionController, AdmissionMiddleware, client_key_from_scope
+from exports import ExportJobManager, ExportLimitExceeded, iter_csv_chunks, iter_file_range, parse_range
+from query_cache import QueryCache, canonical_key, normalize_search
+from reference_data import BIC_PATTERN, ReferenceDataLoader, normalize_iban, validate_iban
+from storage import open_store
+from history import (
+    ConcurrentUpdateError,
+    create_vendor_with_history,
+    get_history,
+    get_vendor_as_of,
+    update_vendor_with_history,
+    update_vendors_with_history,
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs once per worker process, after uvicorn has spawned it, so every
+    # worker owns its own database client and connection pool
+    global store, export_jobs, query_cache, reference
+    store = open_store()
+    store.ensure_schema()
+    reference = ReferenceDataLoader()
+    export_jobs = ExportJobManager(store)
+    query_cache = QueryCache(store)
+    app.state.ready = True
+    yield
+    # uvicorn has stopped accepting connections and drained in-flight
+    # requests by the time the lifespan shutdown runs
+    app.state.ready = False
+    export_jobs.shutdown()
+    store.close()
+
+app = FastAPI(lifespan=lifespan)
+app.state.ready = False
+
+# Admission control (rate limits, per-route concurrency, priorities); added
+# before CORS so shed responses still carry CORS headers
+admission = AdmissionController()
+if ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware, controller=admission)
 
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
->>>>>>> venor/main
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-<<<<<<< HEAD
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
-=======
-# MongoDB connection
-MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/vendordb')
-client = MongoClient(MONGO_URL)
-db = client.vendordb
-vendors_collection = db.vendors
-counter_collection = db.counters
-
-# Initialize vendor counter
-def initialize_counter():
-    if counter_collection.find_one({"_id": "vendor_counter"}) is None:
-        counter_collection.insert_one({"_id": "vendor_counter", "sequence_value": 0})
-
-initialize_counter()
+# Storage backend (opened per worker by the lifespan hook; see storage/)
+store = None
+export_jobs = None
+query_cache = None
+# Bank directory and IBAN formats (see reference_data.py)
+reference = None
 
 def get_next_vendor_id():
-    counter = counter_collection.find_one_and_update(
-        {"_id": "vendor_counter"},
-        {"$inc": {"sequence_value": 1}},
-        return_document=pymongo.ReturnDocument.AFTER,
-        upsert=True
-    )
-    return f"VENDOR{counter['sequence_value']:03d}"
+    return f"VENDOR{store.next_sequence('vendor_counter'):03d}"
 
 # Validation functions
 def validate_email(email: str) -> bool:
@@ -132,10 +85,37 @@ def validate_phone(phone: str) -> bool:
     pattern = r'^\+?[\d\s\-\(\)]{7,20}$'
     return re.match(pattern, phone) is not None
 
-def validate_iban(iban: str) -> bool:
-    # Basic IBAN validation - starts with country code and length check
-    pattern = r'^[A-Z]{2}[0-9]{2}[A-Z0-9]{4}[0-9]{7}([A-Z0-9]?){0,16}$'
-    return re.match(pattern, iban.upper()) is not None
+def current_reference():
+    # None until the lifespan hook has loaded the reference data
+    return reference.current() if reference is not None else None
+
+def iban_error(iban: str) -> Optional[str]:
+    data = current_reference()
+    return validate_iban(iban, data.iban_formats if data else None)
+
+def bic_error(bic: str) -> Optional[str]:
+    # 8 or 11 characters; must be listed once a bank directory is loaded
+    if not BIC_PATTERN.match(bic.upper()):
+        return 'Invalid BIC format'
+    data = current_reference()
+    if data is not None and len(data.banks) and data.banks.lookup(bic) is None:
+        return 'Unknown BIC'
+    return None
+
+def bank_directory_loaded() -> bool:
+    data = current_reference()
+    return data is not None and len(data.banks) > 0
+
+def apply_bank_directory(fields: dict, stored_bic: Optional[str] = None) -> dict:
+    # Bank names come from the directory whenever it knows the BIC: the one
+    # being set, or else (for a bank name on its own) the vendor's stored one
+    data = current_reference()
+    bic = fields.get("bic") or (stored_bic if fields.get("bank_name") else None)
+    if data is not None and bic:
+        bank = data.banks.lookup(bic)
+        if bank is not None:
+            fields["bank_name"] = bank.bank_name
+    return fields
 
 def validate_postal_code(postal_code: str, country: str) -> bool:
     # Basic postal code validation for common countries
@@ -152,6 +132,22 @@ def validate_postal_code(postal_code: str, country: str) -> bool:
         return re.match(patterns[country], postal_code.upper()) is not None
     return len(postal_code) >= 3  # Generic validation for other countries
 
+def parse_vendor_filter(
+    search: Optional[str] = None,
+    country: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[str] = None,
+    created_before: Optional[str] = None
+) -> dict:
+    # Query parameters -> store filter; raises ValueError on bad dates
+    return {
+        "search": search,
+        "country": country,
+        "status": status,
+        "created_after": datetime.strptime(created_after, "%Y-%m-%d") if created_after else None,
+        "created_before": datetime.strptime(created_before, "%Y-%m-%d") if created_before else None
+    }
+
 # Pydantic models
 class VendorCreate(BaseModel):
     company_name: str
@@ -201,15 +197,16 @@ class VendorCreate(BaseModel):
 
     @validator('iban')
     def validate_iban_format(cls, v):
-        if not validate_iban(v):
-            raise ValueError('Invalid IBAN format')
-        return v.upper().replace(' ', '')
+        error = iban_error(v)
+        if error:
+            raise ValueError(error)
+        return normalize_iban(v)
 
     @validator('bic')
     def validate_bic_format(cls, v):
-        # Basic BIC validation - 8 or 11 characters
-        if not re.match(r'^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$', v.upper()):
-            raise ValueError('Invalid BIC format')
+        error = bic_error(v)
+        if error:
+            raise ValueError(error)
         return v.upper()
 
 class VendorUpdate(BaseModel):
@@ -254,16 +251,30 @@ class VendorUpdate(BaseModel):
 
     @validator('iban')
     def validate_iban_format(cls, v):
-        if v is not None and not validate_iban(v):
-            raise ValueError('Invalid IBAN format')
-        return v.upper().replace(' ', '') if v else v
+        error = iban_error(v) if v is not None else None
+        if error:
+            raise ValueError(error)
+        return normalize_iban(v) if v else v
 
     @validator('bic')
     def validate_bic_format(cls, v):
-        if v is not None and not re.match(r'^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$', v.upper()):
-            raise ValueError('Invalid BIC format')
+        error = bic_error(v) if v is not None else None
+        if error:
+            raise ValueError(error)
         return v.upper() if v else v
 
+class VendorFilter(BaseModel):
+    search: Optional[str] = None
+    country: Optional[str] = None
+    status: Optional[str] = None
+    created_after: Optional[str] = None
+    created_before: Optional[str] = None
+
+class VendorBatchUpdate(BaseModel):
+    vendor_ids: Optional[List[str]] = None
+    filter: Optional[VendorFilter] = None
+    update: VendorUpdate
+
 class VendorResponse(BaseModel):
     id: str
     vendor_id: str
@@ -284,12 +295,58 @@ class VendorResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+# Handlers that touch the store are plain `def`: FastAPI runs them in its
+# thread pool, so blocking driver calls never stall the event loop (and with
+# it the admission gates and every other in-flight request)
+
 @app.get("/")
 async def root():
     return {"message": "Vendor Management System API"}
 
+@app.get("/api/health/live")
+async def liveness():
+    return {"status": "alive", "pid": os.getpid()}
+
+@app.get("/api/health/ready")
+def readiness():
+    if not app.state.ready or store is None:
+        raise HTTPException(status_code=503, detail="Worker not ready")
+    try:
+        storage = store.health()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Database unavailable: {e}")
+    return {"status": "ready", "pid": os.getpid(), "storage": storage}
+
+@app.get("/api/admission/stats")
+async def get_admission_stats():
+    return admission.snapshot()
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    return query_cache.stats()
+
+@app.get("/api/reference/stats")
+async def get_reference_stats():
+    return reference.stats()
+
+@app.get("/api/banks/autocomplete")
+def autocomplete_banks(
+    q: str = Query(..., min_length=1, description="Bank name prefix, matched per word"),
+    country: Optional[str] = Query(None, description="ISO country code of the bank"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions")
+):
+    banks = reference.current().banks.autocomplete(q, country_code=country, limit=limit)
+    return {"banks": [bank.to_dict() for bank in banks]}
+
+@app.get("/api/banks/{bic}")
+def get_bank(bic: str):
+    bank = reference.current().banks.lookup(bic)
+    if bank is None:
+        raise HTTPException(status_code=404, detail="BIC not found in bank directory")
+    return {"bank": bank.to_dict()}
+
 @app.get("/api/vendors")
-async def get_vendors(
+def get_vendors(
     search: Optional[str] = Query(None, description="Search by vendor ID, company name, contact person, or email"),
     country: Optional[str] = Query(None, description="Filter by country"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -299,48 +356,35 @@ async def get_vendors(
     offset: Optional[int] = Query(0, description="Offset for pagination")
 ):
     try:
-        # Build query
-        query = {}
-        
-        # Search functionality
-        if search:
-            search_regex = {"$regex": search, "$options": "i"}
-            query["$or"] = [
-                {"vendor_id": search_regex},
-                {"company_name": search_regex},
-                {"contact_person": search_regex},
-                {"email": search_regex}
-            ]
-        
-        # Filters
-        if country:
-            query["country"] = country
-        if status:
-            query["status"] = status
+        search = normalize_search(search)
+        cache_key = canonical_key({
+            "search": search,
+            "country": country,
+            "status": status,
+            "created_after": created_after,
+            "created_before": created_before,
+            "limit": limit,
+            "offset": offset
+        })
+        version = query_cache.current_version()
+        cached = query_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Date filters
-        if created_after or created_before:
-            date_query = {}
-            if created_after:
-                date_query["$gte"] = datetime.strptime(created_after, "%Y-%m-%d")
-            if created_before:
-                date_query["$lte"] = datetime.strptime(created_before, "%Y-%m-%d")
-            query["created_at"] = date_query
+        # Build filter
+        filters = parse_vendor_filter(search, country, status, created_after, created_before)
         
         # Get total count
-        total_count = vendors_collection.count_documents(query)
+        total_count = store.count_vendors(filters)
         
         # Get vendors with pagination
-        vendors = list(vendors_collection.find(query).skip(offset).limit(limit).sort("created_at", -1))
-        
-        for vendor in vendors:
-            vendor["_id"] = str(vendor["_id"])
+        vendors = store.find_vendors(filters, limit=limit, offset=offset)
         
         # Get unique countries and statuses for filter options
-        countries = vendors_collection.distinct("country")
-        statuses = vendors_collection.distinct("status")
+        countries = store.distinct_values("country")
+        statuses = store.distinct_values("status")
         
-        return {
+        result = {
             "vendors": vendors,
             "total_count": total_count,
             "filter_options": {
@@ -348,11 +392,13 @@ async def get_vendors(
                 "statuses": statuses
             }
         }
+        query_cache.put(cache_key, result, version)
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/vendors")
-async def create_vendor(vendor: VendorCreate):
+def create_vendor(vendor: VendorCreate):
     try:
         vendor_id = get_next_vendor_id()
         vendor_data = {
@@ -373,23 +419,120 @@ async def create_vendor(vendor: VendorCreate):
             "documents": vendor.documents or {},
             "status": "active",
             "created_at": datetime.utcnow(),
-            "updated_at": None
+            "updated_at": None,
+            "is_deleted": False,
+            "history_seq": 0
         }
+        apply_bank_directory(vendor_data)
         
-        result = vendors_collection.insert_one(vendor_data)
-        vendor_data["_id"] = str(result.inserted_id)
+        create_vendor_with_history(store, vendor_data)
+        query_cache.bump()
         
         return {"message": "Vendor created successfully", "vendor": vendor_data}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Fixed paths under /api/vendors must be declared before /api/vendors/{vendor_id},
+# which would otherwise capture them (routes match in declaration order)
+@app.get("/api/vendors/stats")
+def get_vendor_stats():
+    try:
+        # Recent vendors (last 30 days)
+        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        return store.vendor_stats(thirty_days_ago)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/vendors/export/csv")
+def export_vendors_csv(
+    search: Optional[str] = Query(None),
+    country: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    created_after: Optional[str] = Query(None),
+    created_before: Optional[str] = Query(None)
+):
+    try:
+        # Build filter (reuse filtering logic)
+        filters = parse_vendor_filter(search, country, status, created_after, created_before)
+        
+        # Rows are encoded and sent as they are read, never buffered whole
+        return StreamingResponse(
+            iter_csv_chunks(store.iter_vendors(filters)),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": f"attachment; filename=vendors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            }
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/vendors/exports", status_code=202)
+def create_export_job(filters: VendorFilter, request: Request):
+    try:
+        job, reused = export_jobs.create_job(
+            parse_vendor_filter(**filters.dict()), client_key_from_scope(request.scope)
+        )
+        return {"job": job, "reused": reused}
+    except ExportLimitExceeded as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers={"Retry-After": str(e.retry_after)})
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format, expected YYYY-MM-DD")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/vendors/exports/{job_id}")
+def get_export_job(job_id: str):
+    job = export_jobs.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return {"job": job}
+
+@app.get("/api/vendors/exports/{job_id}/download")
+def download_export(job_id: str, request: Request):
+    job = export_jobs.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    path = export_jobs.file_path(job_id)
+    if job["status"] != "completed" or not path.exists():
+        raise HTTPException(status_code=409, detail=f"Export is {job['status']}")
+    
+    size = path.stat().st_size
+    filename = f"vendors_{job['created_at'].strftime('%Y%m%d_%H%M%S')}.csv"
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{job_id}-{size}"',
+        "Content-Disposition": f"attachment; filename={filename}"
+    }
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    
+    # A stale If-Range validator means the client must restart from zero
+    if_range = request.headers.get("if-range")
+    if byte_range and if_range and if_range != headers["ETag"]:
+        byte_range = None
+    
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(iter_file_range(path, 0, size - 1), media_type="text/csv", headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file_range(path, start, end),
+        status_code=206,
+        media_type="text/csv",
+        headers=headers
+    )
+
 @app.get("/api/vendors/{vendor_id}")
-async def get_vendor(vendor_id: str):
+def get_vendor(vendor_id: str):
     try:
-        vendor = vendors_collection.find_one({"vendor_id": vendor_id})
+        vendor = store.get_vendor(vendor_id)
         if not vendor:
             raise HTTPException(status_code=404, detail="Vendor not found")
-        vendor["_id"] = str(vendor["_id"])
         return {"vendor": vendor}
     except HTTPException:
         raise
@@ -397,175 +540,168 @@ async def get_vendor(vendor_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/vendors/{vendor_id}")
-async def update_vendor(vendor_id: str, vendor_update: VendorUpdate):
+def update_vendor(vendor_id: str, vendor_update: VendorUpdate):
     try:
-        vendor = vendors_collection.find_one({"vendor_id": vendor_id})
-        if not vendor:
-            raise HTTPException(status_code=404, detail="Vendor not found")
-        
         # Prepare update data
         update_data = {k: v for k, v in vendor_update.dict().items() if v is not None}
+        stored_bic = None
+        if update_data.get("bank_name") and not update_data.get("bic") and bank_directory_loaded():
+            vendor = store.get_vendor(vendor_id)
+            stored_bic = vendor.get("bic") if vendor else None
+        apply_bank_directory(update_data, stored_bic)
         update_data["updated_at"] = datetime.utcnow()
         
-        # Update vendor
-        result = vendors_collection.update_one(
-            {"vendor_id": vendor_id},
-            {"$set": update_data}
-        )
+        # The update and its change log entry are written in one operation
+        updated = update_vendor_with_history(store, vendor_id, update_data)
+        if not updated:
+            raise HTTPException(status_code=404, detail="Vendor not found")
+        _, updated_vendor = updated
+        query_cache.bump()
         
-        if result.modified_count == 0:
-            raise HTTPException(status_code=400, detail="No changes made")
+        return {"message": "Vendor updated successfully", "vendor": updated_vendor}
+    except HTTPException:
+        raise
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Number of vendors read, written and logged per bulk round-trip
+BATCH_CHUNK_SIZE = 1000
+
+def apply_batch_update(vendor_ids: List[str], update_fields: dict, updated_at: datetime) -> dict:
+    outcomes = {}
+    before = {v["vendor_id"]: v for v in store.get_vendors_by_ids(vendor_ids)}
+    
+    pending = {}
+    for vendor_id in vendor_ids:
+        vendor = before.get(vendor_id)
+        if vendor is None:
+            outcomes[vendor_id] = "not_found"
+            continue
+        if all(vendor.get(k) == v for k, v in update_fields.items()):
+            outcomes[vendor_id] = "unchanged"
+            continue
+        pending[vendor_id] = vendor
+    
+    if not pending:
+        return outcomes
+    
+    # Guarded on the history sequence we read so concurrent edits are not overwritten
+    applied = update_vendors_with_history(store, pending, {**update_fields, "updated_at": updated_at})
+    for vendor_id in pending:
+        outcomes[vendor_id] = "updated" if vendor_id in applied else "conflict"
+    return outcomes
+
+@app.patch("/api/vendors/batch")
+def batch_update_vendors(batch: VendorBatchUpdate):
+    try:
+        update_fields = apply_bank_directory({k: v for k, v in batch.update.dict().items() if v is not None})
+        if not update_fields:
+            raise HTTPException(status_code=400, detail="No fields to update")
+        if "bank_name" in update_fields and not update_fields.get("bic") and bank_directory_loaded():
+            # Each vendor's name would come from its own BIC; one value cannot fit all
+            raise HTTPException(status_code=400, detail="bank_name is taken from the bank directory; update bic instead")
         
-        # Get updated vendor
-        updated_vendor = vendors_collection.find_one({"vendor_id": vendor_id})
-        updated_vendor["_id"] = str(updated_vendor["_id"])
+        if batch.vendor_ids:
+            vendor_ids = list(dict.fromkeys(batch.vendor_ids))
+        elif batch.filter and any(batch.filter.dict().values()):
+            try:
+                filters = parse_vendor_filter(**batch.filter.dict())
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid date format, expected YYYY-MM-DD")
+            vendor_ids = store.find_vendor_ids(filters)
+        else:
+            raise HTTPException(status_code=400, detail="Provide vendor_ids or at least one filter")
         
-        return {"message": "Vendor updated successfully", "vendor": updated_vendor}
+        updated_at = datetime.utcnow()
+        outcomes = {}
+        for start in range(0, len(vendor_ids), BATCH_CHUNK_SIZE):
+            chunk = vendor_ids[start:start + BATCH_CHUNK_SIZE]
+            outcomes.update(apply_batch_update(chunk, update_fields, updated_at))
+        
+        summary = Counter(outcomes.values())
+        if summary["updated"]:
+            query_cache.bump()
+        return {
+            "message": f"{summary['updated']} vendors updated",
+            "summary": {
+                "requested": len(vendor_ids),
+                "updated": summary["updated"],
+                "unchanged": summary["unchanged"],
+                "not_found": summary["not_found"],
+                "conflict": summary["conflict"]
+            },
+            "results": [{"vendor_id": vid, "outcome": outcomes[vid]} for vid in vendor_ids]
+        }
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/vendors/{vendor_id}")
-async def delete_vendor(vendor_id: str):
+def delete_vendor(vendor_id: str):
     try:
-        result = vendors_collection.delete_one({"vendor_id": vendor_id})
-        if result.deleted_count == 0:
+        # Soft delete so the vendor's change history stays reconstructible
+        delete_data = {"is_deleted": True, "updated_at": datetime.utcnow()}
+        if not update_vendor_with_history(store, vendor_id, delete_data, action="delete"):
             raise HTTPException(status_code=404, detail="Vendor not found")
+        query_cache.bump()
         return {"message": "Vendor deleted successfully"}
     except HTTPException:
         raise
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/next-vendor-id")
-async def get_next_vendor_id_preview():
+@app.get("/api/vendors/{vendor_id}/history")
+def get_vendor_history(
+    vendor_id: str,
+    limit: Optional[int] = Query(100, description="Limit number of change entries"),
+    offset: Optional[int] = Query(0, description="Offset for pagination")
+):
     try:
-        # Get current counter without incrementing
-        counter = counter_collection.find_one({"_id": "vendor_counter"})
-        if counter:
-            next_id = f"VENDOR{counter['sequence_value'] + 1:03d}"
-        else:
-            next_id = "VENDOR001"
-        return {"next_vendor_id": next_id}
+        changes = get_history(store, vendor_id, limit=limit, offset=offset)
+        if not changes and not store.get_vendor(vendor_id):
+            raise HTTPException(status_code=404, detail="Vendor not found")
+        return {"vendor_id": vendor_id, "changes": changes}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/vendors/export/csv")
-async def export_vendors_csv(
-    search: Optional[str] = Query(None),
-    country: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
-    created_after: Optional[str] = Query(None),
-    created_before: Optional[str] = Query(None)
+@app.get("/api/vendors/{vendor_id}/as-of")
+def get_vendor_at(
+    vendor_id: str,
+    timestamp: str = Query(..., description="Point in time (ISO 8601, UTC)")
 ):
     try:
-        # Build query (reuse filtering logic)
-        query = {}
-        
-        if search:
-            search_regex = {"$regex": search, "$options": "i"}
-            query["$or"] = [
-                {"vendor_id": search_regex},
-                {"company_name": search_regex},
-                {"contact_person": search_regex},
-                {"email": search_regex}
-            ]
-        
-        if country:
-            query["country"] = country
-        if status:
-            query["status"] = status
-        
-        if created_after or created_before:
-            date_query = {}
-            if created_after:
-                date_query["$gte"] = datetime.strptime(created_after, "%Y-%m-%d")
-            if created_before:
-                date_query["$lte"] = datetime.strptime(created_before, "%Y-%m-%d")
-            query["created_at"] = date_query
-        
-        # Get vendors
-        vendors = list(vendors_collection.find(query).sort("created_at", -1))
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write headers
-        headers = [
-            'Vendor ID', 'Company Name', 'Contact Person', 'Email', 'Phone',
-            'Street Address', 'City', 'Postal Code', 'Country',
-            'Bank Name', 'Account Number', 'IBAN', 'BIC', 'Status',
-            'Created At', 'Updated At'
-        ]
-        writer.writerow(headers)
-        
-        # Write data
-        for vendor in vendors:
-            writer.writerow([
-                vendor.get('vendor_id', ''),
-                vendor.get('company_name', ''),
-                vendor.get('contact_person', ''),
-                vendor.get('email', ''),
-                vendor.get('phone', ''),
-                vendor.get('street_address', ''),
-                vendor.get('city', ''),
-                vendor.get('postal_code', ''),
-                vendor.get('country', ''),
-                vendor.get('bank_name', ''),
-                vendor.get('account_number', ''),
-                vendor.get('iban', ''),
-                vendor.get('bic', ''),
-                vendor.get('status', ''),
-                vendor.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if vendor.get('created_at') else '',
-                vendor.get('updated_at', '').strftime('%Y-%m-%d %H:%M:%S') if vendor.get('updated_at') else ''
-            ])
-        
-        output.seek(0)
-        
-        # Return as streaming response
-        return StreamingResponse(
-            io.StringIO(output.getvalue()),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=vendors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            }
-        )
+        try:
+            as_of = datetime.fromisoformat(timestamp)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid timestamp format")
+        # Stored times are naive UTC; an offset in the query must be applied, not dropped
+        if as_of.tzinfo is not None:
+            as_of = as_of.astimezone(timezone.utc).replace(tzinfo=None)
+        vendor = get_vendor_as_of(store, vendor_id, as_of)
+        if not vendor:
+            raise HTTPException(status_code=404, detail="Vendor not found at given time")
+        return {"vendor": vendor, "as_of": as_of}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/vendors/stats")
-async def get_vendor_stats():
+@app.get("/api/next-vendor-id")
+def get_next_vendor_id_preview():
     try:
-        total_vendors = vendors_collection.count_documents({})
-        active_vendors = vendors_collection.count_documents({"status": "active"})
-        inactive_vendors = vendors_collection.count_documents({"status": "inactive"})
-        
-        # Country distribution
-        country_pipeline = [
-            {"$group": {"_id": "$country", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]
-        country_stats = list(vendors_collection.aggregate(country_pipeline))
-        
-        # Recent vendors (last 30 days)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_vendors = vendors_collection.count_documents({
-            "created_at": {"$gte": thirty_days_ago}
-        })
-        
-        return {
-            "total_vendors": total_vendors,
-            "active_vendors": active_vendors,
-            "inactive_vendors": inactive_vendors,
-            "recent_vendors": recent_vendors,
-            "country_distribution": country_stats
-        }
+        # Get current counter without incrementing
+        next_id = f"VENDOR{store.peek_sequence('vendor_counter') + 1:03d}"
+        return {"next_vendor_id": next_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
->>>>>>> venor/main
+    from serve import main
+    main()
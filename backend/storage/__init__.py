@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+from .base import SEARCH_FIELDS, VENDOR_FIELDS, VendorStore
+
+# Backend selection:
+#   STORAGE_BACKEND=mongo   (default) MONGO_URL, MONGO_MAX_POOL_SIZE
+#   STORAGE_BACKEND=sqlite  SQLITE_PATH (default backend/vendors.db)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'mongo')
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017/vendordb')
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+SQLITE_PATH = os.environ.get('SQLITE_PATH', str(Path(__file__).parent.parent / 'vendors.db'))
+
+
+def open_store(backend: str = None) -> VendorStore:
+    # Drivers are imported here so the unused backend's dependencies are
+    # never loaded
+    backend = backend or STORAGE_BACKEND
+    if backend == "mongo":
+        from .mongo import MongoVendorStore
+        return MongoVendorStore(MONGO_URL, max_pool_size=MONGO_MAX_POOL_SIZE)
+    if backend == "sqlite":
+        from .sqlite import SQLiteVendorStore
+        return SQLiteVendorStore(SQLITE_PATH)
+    raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
+
+
+__all__ = ["SEARCH_FIELDS", "VENDOR_FIELDS", "VendorStore", "open_store"]
@@ -0,0 +1,125 @@
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+# Storage interface
+#
+# Everything the vendor endpoints need from a database, in domain terms, so
+# the API does not depend on a particular driver. `filters` arguments are
+# dicts with the optional keys search, country, status, created_after and
+# created_before (datetimes). Vendor documents are plain dicts without any
+# backend-specific `_id`; soft-deleted vendors (is_deleted=True) are never
+# returned by the vendor queries.
+
+VENDOR_FIELDS = [
+    "id", "vendor_id", "company_name", "contact_person", "email", "phone",
+    "street_address", "city", "postal_code", "country", "bank_name",
+    "account_number", "iban", "bic", "documents", "status", "created_at",
+    "updated_at", "is_deleted", "history_seq"
+]
+
+# Fields searched by the `search` filter
+SEARCH_FIELDS = ["vendor_id", "company_name", "contact_person", "email"]
+
+
+class VendorStore:
+    name = "base"
+
+    # Lifecycle
+
+    def ensure_schema(self):
+        raise NotImplementedError
+
+    def health(self) -> dict:
+        # Raises when the backend is unusable
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    # Atomic counters
+
+    def next_sequence(self, name: str) -> int:
+        raise NotImplementedError
+
+    def peek_sequence(self, name: str) -> int:
+        raise NotImplementedError
+
+    # Vendors
+
+    def insert_vendor(self, vendor: dict, history: Optional[dict] = None):
+        # `history` is the vendor's creation record (see history.py), written
+        # in the same atomic operation as the vendor
+        raise NotImplementedError
+
+    def get_vendor(self, vendor_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def get_vendors_by_ids(self, vendor_ids: List[str]) -> List[dict]:
+        raise NotImplementedError
+
+    def bulk_update_vendors(self, expected_seqs: dict, fields: dict, history: Optional[dict] = None) -> set:
+        # Set `fields` (and increment history_seq) on every vendor in
+        # {vendor_id: history_seq} whose history_seq is still the expected
+        # one. Returns the vendor_ids that were updated. `history` maps
+        # vendor_ids to change records (see history.py); an updated vendor's
+        # record is written in the same atomic operation as its update, and
+        # the records of vendors that were not updated are dropped.
+        raise NotImplementedError
+
+    def find_vendors(self, filters: dict, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        # Newest first
+        raise NotImplementedError
+
+    def iter_vendors(self, filters: dict, batch_size: int = 1000) -> Iterator[dict]:
+        # Newest first, without materializing the whole result
+        raise NotImplementedError
+
+    def find_vendor_ids(self, filters: dict) -> List[str]:
+        raise NotImplementedError
+
+    def count_vendors(self, filters: dict) -> int:
+        raise NotImplementedError
+
+    def distinct_values(self, field: str) -> list:
+        raise NotImplementedError
+
+    def vendor_stats(self, recent_since: datetime) -> dict:
+        # {"total_vendors", "active_vendors", "inactive_vendors",
+        #  "recent_vendors", "country_distribution": [{"_id", "count"}]}
+        raise NotImplementedError
+
+    # Change history (written through insert_vendor / bulk_update_vendors)
+
+    def list_changes(self, vendor_id: str, limit: int = 100, offset: int = 0) -> List[dict]:
+        # Newest first
+        raise NotImplementedError
+
+    def changes_after(self, vendor_id: str, seq: int, until: datetime) -> List[dict]:
+        # Oldest first
+        raise NotImplementedError
+
+    def latest_snapshot(self, vendor_id: str, until: datetime) -> Optional[dict]:
+        # {"seq", "state", "taken_at"} of the newest snapshot taken at or before `until`
+        raise NotImplementedError
+
+    # Export jobs
+
+    def insert_export_job(self, job: dict):
+        raise NotImplementedError
+
+    def get_export_job(self, job_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def find_export_jobs(self, filter_hash: str, statuses: List[str], since: datetime) -> List[dict]:
+        # Newest first
+        raise NotImplementedError
+
+    def update_export_job(self, job_id: str, fields: dict):
+        raise NotImplementedError
+
+    def update_export_jobs(self, job_ids: List[str], fields: dict):
+        raise NotImplementedError
+
+    def expire_export_jobs(self, before: datetime) -> List[str]:
+        # Delete jobs created before `before`; returns their job_ids
+        raise NotImplementedError
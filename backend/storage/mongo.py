@@ -0,0 +1,291 @@
+import re
+import uuid
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+import pymongo
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .base import SEARCH_FIELDS, VendorStore
+
+# Indexes only cover live vendors; soft-deleted vendors are kept for the
+# change history but excluded through partial filters
+LIVE_VENDOR = {"is_deleted": False}
+
+# History outbox: a vendor write pushes its history record onto the vendor's
+# own `pending_history` array in the same single-document update, which Mongo
+# applies atomically. The records are then copied into vendor_changes and
+# vendor_snapshots and pulled off the vendor. A crash in between leaves them
+# in the outbox, and they are flushed at startup and before history reads.
+PENDING_HISTORY = {"pending_history": {"$exists": True}}
+
+NO_ID = {"_id": 0}
+VENDOR_PROJECTION = {"_id": 0, "pending_history": 0, "write_token": 0}
+
+DUPLICATE_KEY = 11000
+
+
+def ignore_duplicates(write):
+    # History writes are replayed when a flush is retried; rows that are
+    # already there are fine
+    try:
+        write()
+    except BulkWriteError as e:
+        if any(error["code"] != DUPLICATE_KEY for error in e.details["writeErrors"]):
+            raise
+
+
+def build_vendor_query(filters: dict) -> dict:
+    query = dict(LIVE_VENDOR)
+
+    # Search is a literal, case-insensitive substring match (as on SQLite)
+    search = filters.get("search")
+    if search:
+        search_regex = {"$regex": re.escape(search), "$options": "i"}
+        query["$or"] = [{field: search_regex} for field in SEARCH_FIELDS]
+
+    # Filters
+    if filters.get("country"):
+        query["country"] = filters["country"]
+    if filters.get("status"):
+        query["status"] = filters["status"]
+
+    # Date filters
+    created_after = filters.get("created_after")
+    created_before = filters.get("created_before")
+    if created_after or created_before:
+        date_query = {}
+        if created_after:
+            date_query["$gte"] = created_after
+        if created_before:
+            date_query["$lte"] = created_before
+        query["created_at"] = date_query
+
+    return query
+
+
+class MongoVendorStore(VendorStore):
+    name = "mongo"
+
+    def __init__(self, url: str, max_pool_size: int = 100, db_name: str = "vendordb"):
+        self.client = MongoClient(url, maxPoolSize=max_pool_size, serverSelectionTimeoutMS=5000)
+        self.max_pool_size = max_pool_size
+        self.db = self.client[db_name]
+        self.vendors = self.db.vendors
+        self.counters = self.db.counters
+        self.changes = self.db.vendor_changes
+        self.snapshots = self.db.vendor_snapshots
+        self.export_jobs = self.db.export_jobs
+
+    # Lifecycle
+
+    def ensure_schema(self):
+        if self.counters.find_one({"_id": "vendor_counter"}) is None:
+            self.counters.insert_one({"_id": "vendor_counter", "sequence_value": 0})
+        # Vendors created before soft deletes existed have no is_deleted flag
+        self.vendors.update_many({"is_deleted": {"$exists": False}}, {"$set": LIVE_VENDOR})
+        self.vendors.create_index("vendor_id", unique=True, partialFilterExpression=LIVE_VENDOR)
+        self.vendors.create_index([("created_at", -1)], partialFilterExpression=LIVE_VENDOR)
+        self.vendors.create_index("country", partialFilterExpression=LIVE_VENDOR)
+        self.vendors.create_index("status", partialFilterExpression=LIVE_VENDOR)
+        self.vendors.create_index(
+            [("vendor_id", 1), ("pending_history.seq", 1)], partialFilterExpression=PENDING_HISTORY
+        )
+        self.changes.create_index([("vendor_id", 1), ("seq", 1)], unique=True)
+        self.changes.create_index([("vendor_id", 1), ("changed_at", 1)])
+        self.snapshots.create_index([("vendor_id", 1), ("seq", 1)], unique=True)
+        self.snapshots.create_index([("vendor_id", 1), ("taken_at", 1)])
+        self.export_jobs.create_index("job_id", unique=True)
+        self.export_jobs.create_index([("filter_hash", 1), ("created_at", -1)])
+        # History records left behind by a crash between write and flush
+        self.flush_history()
+
+    def health(self) -> dict:
+        self.client.admin.command("ping")
+        return {"backend": self.name, "nodes": len(self.client.nodes), "max_pool_size": self.max_pool_size}
+
+    def close(self):
+        self.client.close()
+
+    # Atomic counters
+
+    def next_sequence(self, name: str) -> int:
+        counter = self.counters.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"sequence_value": 1}},
+            return_document=pymongo.ReturnDocument.AFTER,
+            upsert=True
+        )
+        return counter["sequence_value"]
+
+    def peek_sequence(self, name: str) -> int:
+        counter = self.counters.find_one({"_id": name})
+        return counter["sequence_value"] if counter else 0
+
+    # Vendors
+
+    def insert_vendor(self, vendor: dict, history: Optional[dict] = None):
+        document = dict(vendor)
+        if history:
+            document["pending_history"] = [history]
+        self.vendors.insert_one(document)
+        if history:
+            self.flush_history([vendor["vendor_id"]])
+
+    def get_vendor(self, vendor_id: str) -> Optional[dict]:
+        return self.vendors.find_one({"vendor_id": vendor_id, **LIVE_VENDOR}, VENDOR_PROJECTION)
+
+    def get_vendors_by_ids(self, vendor_ids: List[str]) -> List[dict]:
+        return list(self.vendors.find({"vendor_id": {"$in": vendor_ids}, **LIVE_VENDOR}, VENDOR_PROJECTION))
+
+    def bulk_update_vendors(self, expected_seqs: dict, fields: dict, history: Optional[dict] = None) -> set:
+        if not expected_seqs:
+            return set()
+        history = history or {}
+        # Stamp the batch with a token unique to this call so the applied
+        # vendors can be told apart afterwards; timestamps are only stored to
+        # the millisecond and can repeat across calls
+        write_token = uuid.uuid4().hex
+        operations = []
+        for vendor_id, seq in expected_seqs.items():
+            update = {"$set": {**fields, "write_token": write_token}, "$inc": {"history_seq": 1}}
+            if vendor_id in history:
+                update["$push"] = {"pending_history": history[vendor_id]}
+            operations.append(UpdateOne({"vendor_id": vendor_id, "history_seq": seq, **LIVE_VENDOR}, update))
+        result = self.vendors.bulk_write(operations, ordered=False)
+        if result.matched_count == len(operations):
+            applied = set(expected_seqs)
+        elif result.matched_count == 0:
+            applied = set()
+        else:
+            applied = {
+                v["vendor_id"] for v in self.vendors.find(
+                    {"vendor_id": {"$in": list(expected_seqs)}, "write_token": write_token},
+                    {"vendor_id": 1, "_id": 0}
+                )
+            }
+        if history:
+            self.flush_history([vendor_id for vendor_id in applied if vendor_id in history])
+        return applied
+
+    def find_vendors(self, filters: dict, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        cursor = self.vendors.find(build_vendor_query(filters), VENDOR_PROJECTION).sort("created_at", -1).skip(offset)
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    def iter_vendors(self, filters: dict, batch_size: int = 1000) -> Iterator[dict]:
+        return self.vendors.find(
+            build_vendor_query(filters), VENDOR_PROJECTION
+        ).sort("created_at", -1).batch_size(batch_size)
+
+    def find_vendor_ids(self, filters: dict) -> List[str]:
+        return [v["vendor_id"] for v in self.vendors.find(build_vendor_query(filters), {"vendor_id": 1, "_id": 0})]
+
+    def count_vendors(self, filters: dict) -> int:
+        return self.vendors.count_documents(build_vendor_query(filters))
+
+    def distinct_values(self, field: str) -> list:
+        return self.vendors.distinct(field, LIVE_VENDOR)
+
+    def vendor_stats(self, recent_since: datetime) -> dict:
+        # Country distribution
+        country_pipeline = [
+            {"$match": LIVE_VENDOR},
+            {"$group": {"_id": "$country", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}}
+        ]
+        return {
+            "total_vendors": self.vendors.count_documents(LIVE_VENDOR),
+            "active_vendors": self.vendors.count_documents({"status": "active", **LIVE_VENDOR}),
+            "inactive_vendors": self.vendors.count_documents({"status": "inactive", **LIVE_VENDOR}),
+            "recent_vendors": self.vendors.count_documents({"created_at": {"$gte": recent_since}, **LIVE_VENDOR}),
+            "country_distribution": list(self.vendors.aggregate(country_pipeline))
+        }
+
+    # Change history
+
+    def flush_history(self, vendor_ids: Optional[List[str]] = None):
+        # Move outbox records into the history collections: all of them, or
+        # those of `vendor_ids` (deleted vendors included)
+        query = dict(PENDING_HISTORY)
+        if vendor_ids is not None:
+            if not vendor_ids:
+                return
+            query["vendor_id"] = {"$in": list(vendor_ids)}
+        pending = list(self.vendors.find(query, {"pending_history": 1}))
+        if not pending:
+            return
+        records = [record for vendor in pending for record in vendor["pending_history"]]
+        # Copies, so the driver does not add `_id` to the records
+        changes = [dict(record["change"]) for record in records if record["change"]]
+        if changes:
+            ignore_duplicates(lambda: self.changes.insert_many(changes, ordered=False))
+        snapshots = [
+            UpdateOne(
+                {"vendor_id": snapshot["vendor_id"], "seq": snapshot["seq"]},
+                {"$setOnInsert": {"state": snapshot["state"], "taken_at": snapshot["taken_at"]}},
+                upsert=True
+            )
+            for record in records for snapshot in record["snapshots"]
+        ]
+        if snapshots:
+            ignore_duplicates(lambda: self.snapshots.bulk_write(snapshots, ordered=False))
+        # Pull only what was flushed; records pushed meanwhile stay queued
+        self.vendors.bulk_write([
+            UpdateOne(
+                {"_id": vendor["_id"]},
+                {"$pull": {"pending_history": {"seq": {"$in": [r["seq"] for r in vendor["pending_history"]]}}}}
+            )
+            for vendor in pending
+        ], ordered=False)
+        self.vendors.update_many(
+            {"_id": {"$in": [vendor["_id"] for vendor in pending]}, "pending_history": {"$size": 0}},
+            {"$unset": {"pending_history": ""}}
+        )
+
+    def list_changes(self, vendor_id: str, limit: int = 100, offset: int = 0) -> List[dict]:
+        self.flush_history([vendor_id])
+        return list(self.changes.find({"vendor_id": vendor_id}, NO_ID).sort("seq", -1).skip(offset).limit(limit))
+
+    def changes_after(self, vendor_id: str, seq: int, until: datetime) -> List[dict]:
+        self.flush_history([vendor_id])
+        return list(self.changes.find(
+            {"vendor_id": vendor_id, "seq": {"$gt": seq}, "changed_at": {"$lte": until}},
+            NO_ID
+        ).sort("seq", 1))
+
+    def latest_snapshot(self, vendor_id: str, until: datetime) -> Optional[dict]:
+        self.flush_history([vendor_id])
+        return self.snapshots.find_one(
+            {"vendor_id": vendor_id, "taken_at": {"$lte": until}},
+            NO_ID,
+            sort=[("seq", -1)]
+        )
+
+    # Export jobs
+
+    def insert_export_job(self, job: dict):
+        self.export_jobs.insert_one(dict(job))
+
+    def get_export_job(self, job_id: str) -> Optional[dict]:
+        return self.export_jobs.find_one({"job_id": job_id}, NO_ID)
+
+    def find_export_jobs(self, filter_hash: str, statuses: List[str], since: datetime) -> List[dict]:
+        return list(self.export_jobs.find(
+            {"filter_hash": filter_hash, "status": {"$in": list(statuses)}, "created_at": {"$gte": since}},
+            NO_ID
+        ).sort("created_at", -1))
+
+    def update_export_job(self, job_id: str, fields: dict):
+        self.export_jobs.update_one({"job_id": job_id}, {"$set": fields})
+
+    def update_export_jobs(self, job_ids: List[str], fields: dict):
+        self.export_jobs.update_many({"job_id": {"$in": job_ids}}, {"$set": fields})
+
+    def expire_export_jobs(self, before: datetime) -> List[str]:
+        job_ids = [job["job_id"] for job in self.export_jobs.find({"created_at": {"$lt": before}}, {"job_id": 1})]
+        if job_ids:
+            self.export_jobs.delete_many({"job_id": {"$in": job_ids}})
+        return job_ids
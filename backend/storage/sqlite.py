@@ -0,0 +1,458 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from .base import SEARCH_FIELDS, VENDOR_FIELDS, VendorStore
+
+# Embedded SQLite backend
+#
+# One connection per thread (WAL mode lets readers run alongside the single
+# writer). Vendors are stored in typed columns with partial indexes on live
+# rows, and `search` goes through an FTS5 trigram index, which gives the same
+# literal, case-insensitive substring matching as the Mongo search for terms of
+# three or more characters; shorter terms fall back to LIKE.
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+DATETIME_FIELDS = {"created_at", "updated_at"}
+JSON_FIELDS = {"documents"}
+BOOL_FIELDS = {"is_deleted"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    sequence_value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS vendors (
+    id TEXT NOT NULL,
+    vendor_id TEXT NOT NULL,
+    company_name TEXT,
+    contact_person TEXT,
+    email TEXT,
+    phone TEXT,
+    street_address TEXT,
+    city TEXT,
+    postal_code TEXT,
+    country TEXT,
+    bank_name TEXT,
+    account_number TEXT,
+    iban TEXT,
+    bic TEXT,
+    documents TEXT,
+    status TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    is_deleted INTEGER NOT NULL DEFAULT 0,
+    history_seq INTEGER NOT NULL DEFAULT 0
+);
+CREATE UNIQUE INDEX IF NOT EXISTS vendors_vendor_id ON vendors (vendor_id) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS vendors_created_at ON vendors (created_at DESC) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS vendors_country ON vendors (country, created_at DESC) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS vendors_status ON vendors (status, created_at DESC) WHERE is_deleted = 0;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS vendors_fts USING fts5(
+    vendor_id, company_name, contact_person, email,
+    content='vendors', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS vendors_fts_insert AFTER INSERT ON vendors BEGIN
+    INSERT INTO vendors_fts (rowid, vendor_id, company_name, contact_person, email)
+    VALUES (new.rowid, new.vendor_id, new.company_name, new.contact_person, new.email);
+END;
+CREATE TRIGGER IF NOT EXISTS vendors_fts_delete AFTER DELETE ON vendors BEGIN
+    INSERT INTO vendors_fts (vendors_fts, rowid, vendor_id, company_name, contact_person, email)
+    VALUES ('delete', old.rowid, old.vendor_id, old.company_name, old.contact_person, old.email);
+END;
+CREATE TRIGGER IF NOT EXISTS vendors_fts_update AFTER UPDATE OF vendor_id, company_name, contact_person, email ON vendors BEGIN
+    INSERT INTO vendors_fts (vendors_fts, rowid, vendor_id, company_name, contact_person, email)
+    VALUES ('delete', old.rowid, old.vendor_id, old.company_name, old.contact_person, old.email);
+    INSERT INTO vendors_fts (rowid, vendor_id, company_name, contact_person, email)
+    VALUES (new.rowid, new.vendor_id, new.company_name, new.contact_person, new.email);
+END;
+
+CREATE TABLE IF NOT EXISTS vendor_changes (
+    vendor_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    changed_at TEXT NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (vendor_id, seq)
+);
+
+CREATE TABLE IF NOT EXISTS vendor_snapshots (
+    vendor_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    taken_at TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (vendor_id, seq)
+);
+CREATE INDEX IF NOT EXISTS vendor_snapshots_taken_at ON vendor_snapshots (vendor_id, taken_at);
+
+CREATE TABLE IF NOT EXISTS export_jobs (
+    job_id TEXT PRIMARY KEY,
+    filter_hash TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    job TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS export_jobs_filter_hash ON export_jobs (filter_hash, created_at DESC);
+"""
+
+
+def format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime(DATETIME_FORMAT) if value is not None else None
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.strptime(value, DATETIME_FORMAT) if value is not None else None
+
+
+def encode_json(value) -> str:
+    # Datetimes survive the round trip as {"$date": "..."}
+    def default(obj):
+        if isinstance(obj, datetime):
+            return {"$date": format_datetime(obj)}
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+    return json.dumps(value, default=default)
+
+
+def decode_json(text: Optional[str]):
+    if text is None:
+        return None
+
+    def object_hook(obj):
+        if len(obj) == 1 and "$date" in obj:
+            return parse_datetime(obj["$date"])
+        return obj
+    return json.loads(text, object_hook=object_hook)
+
+
+def vendor_to_row(vendor: dict) -> dict:
+    row = {}
+    for field in VENDOR_FIELDS:
+        value = vendor.get(field)
+        if field in DATETIME_FIELDS:
+            value = format_datetime(value)
+        elif field in JSON_FIELDS:
+            value = encode_json(value) if value is not None else None
+        elif field in BOOL_FIELDS:
+            value = int(bool(value))
+        elif field == "history_seq":
+            value = value or 0
+        row[field] = value
+    return row
+
+
+def row_to_vendor(row: sqlite3.Row) -> dict:
+    vendor = {}
+    for field in VENDOR_FIELDS:
+        value = row[field]
+        if field in DATETIME_FIELDS:
+            value = parse_datetime(value)
+        elif field in JSON_FIELDS:
+            value = decode_json(value)
+        elif field in BOOL_FIELDS:
+            value = bool(value)
+        vendor[field] = value
+    return vendor
+
+
+def build_vendor_where(filters: dict) -> tuple:
+    clauses = ["is_deleted = 0"]
+    params = []
+
+    search = filters.get("search")
+    if search:
+        if len(search) >= 3:
+            clauses.append("rowid IN (SELECT rowid FROM vendors_fts WHERE vendors_fts MATCH ?)")
+            params.append('"' + search.replace('"', '""') + '"')
+        else:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clauses.append("(" + " OR ".join(f"{field} LIKE ? ESCAPE '\\'" for field in SEARCH_FIELDS) + ")")
+            params.extend([pattern] * len(SEARCH_FIELDS))
+
+    if filters.get("country"):
+        clauses.append("country = ?")
+        params.append(filters["country"])
+    if filters.get("status"):
+        clauses.append("status = ?")
+        params.append(filters["status"])
+    if filters.get("created_after"):
+        clauses.append("created_at >= ?")
+        params.append(format_datetime(filters["created_after"]))
+    if filters.get("created_before"):
+        clauses.append("created_at <= ?")
+        params.append(format_datetime(filters["created_before"]))
+
+    return " AND ".join(clauses), params
+
+
+class SQLiteVendorStore(VendorStore):
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self.local = threading.local()
+        self.connections = []
+        self.connections_lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        # Autocommit mode; multi-statement writes use `transaction()`
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.connect()
+            self.local.conn = conn
+            with self.connections_lock:
+                self.connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # Lifecycle
+
+    def ensure_schema(self):
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR IGNORE INTO counters (name, sequence_value) VALUES ('vendor_counter', 0)")
+
+    def health(self) -> dict:
+        self.conn.execute("SELECT 1").fetchone()
+        mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        return {"backend": self.name, "path": self.path, "journal_mode": mode}
+
+    def close(self):
+        with self.connections_lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections.clear()
+        self.local = threading.local()
+
+    # Atomic counters
+
+    def next_sequence(self, name: str) -> int:
+        row = self.conn.execute(
+            "INSERT INTO counters (name, sequence_value) VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET sequence_value = sequence_value + 1 "
+            "RETURNING sequence_value",
+            (name,)
+        ).fetchone()
+        return row[0]
+
+    def peek_sequence(self, name: str) -> int:
+        row = self.conn.execute("SELECT sequence_value FROM counters WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else 0
+
+    # Vendors
+
+    def insert_vendor(self, vendor: dict, history: Optional[dict] = None):
+        row = vendor_to_row(vendor)
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with self.transaction() as conn:
+            conn.execute(f"INSERT INTO vendors ({columns}) VALUES ({placeholders})", list(row.values()))
+            self.write_history(conn, [history] if history else [])
+
+    def get_vendor(self, vendor_id: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT * FROM vendors WHERE vendor_id = ? AND is_deleted = 0", (vendor_id,)
+        ).fetchone()
+        return row_to_vendor(row) if row else None
+
+    def get_vendors_by_ids(self, vendor_ids: List[str]) -> List[dict]:
+        if not vendor_ids:
+            return []
+        placeholders = ", ".join("?" for _ in vendor_ids)
+        rows = self.conn.execute(
+            f"SELECT * FROM vendors WHERE vendor_id IN ({placeholders}) AND is_deleted = 0", list(vendor_ids)
+        ).fetchall()
+        return [row_to_vendor(row) for row in rows]
+
+    def set_clause(self, fields: dict) -> tuple:
+        unknown = set(fields) - set(VENDOR_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown vendor fields: {sorted(unknown)}")
+        row = vendor_to_row(fields)
+        assignments = [f"{field} = ?" for field in fields] + ["history_seq = history_seq + 1"]
+        return ", ".join(assignments), [row[field] for field in fields]
+
+    def bulk_update_vendors(self, expected_seqs: dict, fields: dict, history: Optional[dict] = None) -> set:
+        assignments, params = self.set_clause(fields)
+        history = history or {}
+        applied = set()
+        with self.transaction() as conn:
+            for vendor_id, seq in expected_seqs.items():
+                cursor = conn.execute(
+                    f"UPDATE vendors SET {assignments} "
+                    "WHERE vendor_id = ? AND history_seq = ? AND is_deleted = 0",
+                    params + [vendor_id, seq or 0]
+                )
+                if cursor.rowcount:
+                    applied.add(vendor_id)
+            self.write_history(conn, [history[vendor_id] for vendor_id in applied if vendor_id in history])
+        return applied
+
+    def find_vendors(self, filters: dict, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        where, params = build_vendor_where(filters)
+        sql = f"SELECT * FROM vendors WHERE {where} ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        rows = self.conn.execute(sql, params + [limit if limit else -1, offset or 0]).fetchall()
+        return [row_to_vendor(row) for row in rows]
+
+    def iter_vendors(self, filters: dict, batch_size: int = 1000) -> Iterator[dict]:
+        # Own connection: a streamed response resumes this generator on
+        # whichever pool thread is free, and must not share that thread's
+        # connection with the request it is serving
+        where, params = build_vendor_where(filters)
+        conn = self.connect()
+        try:
+            cursor = conn.execute(f"SELECT * FROM vendors WHERE {where} ORDER BY created_at DESC", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row_to_vendor(row)
+        finally:
+            conn.close()
+
+    def find_vendor_ids(self, filters: dict) -> List[str]:
+        where, params = build_vendor_where(filters)
+        return [row[0] for row in self.conn.execute(f"SELECT vendor_id FROM vendors WHERE {where}", params)]
+
+    def count_vendors(self, filters: dict) -> int:
+        where, params = build_vendor_where(filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM vendors WHERE {where}", params).fetchone()[0]
+
+    def distinct_values(self, field: str) -> list:
+        if field not in VENDOR_FIELDS:
+            raise ValueError(f"Unknown vendor field: {field}")
+        rows = self.conn.execute(f"SELECT DISTINCT {field} FROM vendors WHERE is_deleted = 0 ORDER BY {field}")
+        return [row[0] for row in rows]
+
+    def vendor_stats(self, recent_since: datetime) -> dict:
+        totals = self.conn.execute(
+            "SELECT COUNT(*), "
+            "COALESCE(SUM(status = 'active'), 0), "
+            "COALESCE(SUM(status = 'inactive'), 0), "
+            "COALESCE(SUM(created_at >= ?), 0) "
+            "FROM vendors WHERE is_deleted = 0",
+            (format_datetime(recent_since),)
+        ).fetchone()
+        countries = self.conn.execute(
+            "SELECT country, COUNT(*) AS count FROM vendors WHERE is_deleted = 0 "
+            "GROUP BY country ORDER BY count DESC"
+        ).fetchall()
+        return {
+            "total_vendors": totals[0],
+            "active_vendors": totals[1],
+            "inactive_vendors": totals[2],
+            "recent_vendors": totals[3],
+            "country_distribution": [{"_id": row[0], "count": row[1]} for row in countries]
+        }
+
+    # Change history
+
+    def write_history(self, conn: sqlite3.Connection, records: List[dict]):
+        # Runs inside the caller's transaction
+        changes = [record["change"] for record in records if record["change"]]
+        if changes:
+            conn.executemany(
+                "INSERT INTO vendor_changes (vendor_id, seq, changed_at, entry) VALUES (?, ?, ?, ?)",
+                [
+                    (e["vendor_id"], e["seq"], format_datetime(e["changed_at"]), encode_json(e))
+                    for e in changes
+                ]
+            )
+        snapshots = [snapshot for record in records for snapshot in record["snapshots"]]
+        if snapshots:
+            conn.executemany(
+                "INSERT OR IGNORE INTO vendor_snapshots (vendor_id, seq, taken_at, state) VALUES (?, ?, ?, ?)",
+                [
+                    (s["vendor_id"], s["seq"], format_datetime(s["taken_at"]), encode_json(s["state"]))
+                    for s in snapshots
+                ]
+            )
+
+    def list_changes(self, vendor_id: str, limit: int = 100, offset: int = 0) -> List[dict]:
+        rows = self.conn.execute(
+            "SELECT entry FROM vendor_changes WHERE vendor_id = ? ORDER BY seq DESC LIMIT ? OFFSET ?",
+            (vendor_id, limit, offset)
+        )
+        return [decode_json(row[0]) for row in rows]
+
+    def changes_after(self, vendor_id: str, seq: int, until: datetime) -> List[dict]:
+        rows = self.conn.execute(
+            "SELECT entry FROM vendor_changes WHERE vendor_id = ? AND seq > ? AND changed_at <= ? ORDER BY seq",
+            (vendor_id, seq, format_datetime(until))
+        )
+        return [decode_json(row[0]) for row in rows]
+
+    def latest_snapshot(self, vendor_id: str, until: datetime) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT seq, state, taken_at FROM vendor_snapshots "
+            "WHERE vendor_id = ? AND taken_at <= ? ORDER BY seq DESC LIMIT 1",
+            (vendor_id, format_datetime(until))
+        ).fetchone()
+        if row is None:
+            return None
+        return {"seq": row[0], "state": decode_json(row[1]), "taken_at": parse_datetime(row[2])}
+
+    # Export jobs
+
+    def insert_export_job(self, job: dict):
+        self.conn.execute(
+            "INSERT INTO export_jobs (job_id, filter_hash, status, created_at, job) VALUES (?, ?, ?, ?, ?)",
+            (job["job_id"], job["filter_hash"], job["status"], format_datetime(job["created_at"]), encode_json(job))
+        )
+
+    def get_export_job(self, job_id: str) -> Optional[dict]:
+        row = self.conn.execute("SELECT job FROM export_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return decode_json(row[0]) if row else None
+
+    def find_export_jobs(self, filter_hash: str, statuses: List[str], since: datetime) -> List[dict]:
+        placeholders = ", ".join("?" for _ in statuses)
+        rows = self.conn.execute(
+            f"SELECT job FROM export_jobs WHERE filter_hash = ? AND status IN ({placeholders}) "
+            "AND created_at >= ? ORDER BY created_at DESC",
+            [filter_hash, *statuses, format_datetime(since)]
+        )
+        return [decode_json(row[0]) for row in rows]
+
+    def update_export_job(self, job_id: str, fields: dict):
+        self.update_export_jobs([job_id], fields)
+
+    def update_export_jobs(self, job_ids: List[str], fields: dict):
+        with self.transaction() as conn:
+            for job_id in job_ids:
+                row = conn.execute("SELECT job FROM export_jobs WHERE job_id = ?", (job_id,)).fetchone()
+                if row is None:
+                    continue
+                job = {**decode_json(row[0]), **fields}
+                conn.execute(
+                    "UPDATE export_jobs SET status = ?, job = ? WHERE job_id = ?",
+                    (job["status"], encode_json(job), job_id)
+                )
+
+    def expire_export_jobs(self, before: datetime) -> List[str]:
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "DELETE FROM export_jobs WHERE created_at < ? RETURNING job_id", (format_datetime(before),)
+            ).fetchall()
+        return [row[0] for row in rows]
@@ -217,6 +217,37 @@ class VendorAPITester:
         except Exception as e:
             return self.log_test("GET Non-existent Vendor", False, f"Error: {str(e)}")
 
+    def test_batch_update_vendors(self):
+        """Test PATCH /api/vendors/batch with explicit vendor IDs"""
+        if not self.created_vendor_id:
+            return self.log_test("PATCH Batch Update", False, "No vendor ID available")
+            
+        try:
+            response = requests.patch(
+                f"{self.base_url}/api/vendors/batch",
+                json={
+                    "vendor_ids": [self.created_vendor_id, "VENDOR999"],
+                    "update": {"city": "Boston"}
+                },
+                headers={'Content-Type': 'application/json'},
+                timeout=30
+            )
+            success = response.status_code == 200
+            details = f"Status: {response.status_code}"
+            
+            if success:
+                data = response.json()
+                outcomes = {r['vendor_id']: r['outcome'] for r in data.get('results', [])}
+                details += f", Outcomes: {outcomes}"
+                success = (
+                    outcomes.get(self.created_vendor_id) == "updated"
+                    and outcomes.get("VENDOR999") == "not_found"
+                )
+                    
+            return self.log_test("PATCH Batch Update", success, details)
+        except Exception as e:
+            return self.log_test("PATCH Batch Update", False, f"Error: {str(e)}")
+
     def run_all_tests(self):
         """Run all API tests"""
         print("🚀 Starting Vendor Management System API Tests")
@@ -232,6 +263,7 @@ class VendorAPITester:
         self.test_get_specific_vendor()
         self.test_create_vendor_invalid_data()
         self.test_get_nonexistent_vendor()
+        self.test_batch_update_vendors()
         
         # Summary
         print("=" * 60)
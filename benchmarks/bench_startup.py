@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the backend.
+
+Measures, over several fresh interpreters:
+  - import: wall time of `import server` (what every worker spawn pays)
+  - ready:  process start until /api/health/ready answers 200 with one worker
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BACKEND_DIR = ROOT_DIR / "backend"
+SERVE = BACKEND_DIR / "serve.py"
+
+
+def measure_import():
+    code = "import time; t = time.perf_counter(); import server; print(time.perf_counter() - t)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+
+def measure_ready(port, timeout=60):
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, str(SERVE), "--workers", "1", "--port", str(port), "--host", "127.0.0.1"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            try:
+                response = requests.get(f"http://127.0.0.1:{port}/api/health/ready", timeout=1)
+                if response.status_code == 200:
+                    return time.perf_counter() - started
+            except requests.RequestException:
+                pass
+            time.sleep(0.02)
+        raise RuntimeError("server did not become ready")
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+
+def report(name, samples):
+    ms = [s * 1000 for s in samples]
+    print(f"{name:>8}: median {statistics.median(ms):7.1f}ms  min {min(ms):7.1f}ms  max {max(ms):7.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8012)
+    parser.add_argument("--skip-ready", action="store_true", help="Only measure import time (no Mongo needed)")
+    args = parser.parse_args()
+
+    report("import", [measure_import() for _ in range(args.runs)])
+    if not args.skip_ready:
+        report("ready", [measure_ready(args.port) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
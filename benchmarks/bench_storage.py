@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Storage backend benchmark.
+
+Runs the same workload against each storage backend: bulk load N vendors,
+then time the operations behind the vendor endpoints (paginated list,
+count, filtered list, search, stats, single update, batch update).
+
+    python benchmarks/bench_storage.py --vendors 100000 --backends sqlite,mongo
+
+The Mongo backend uses MONGO_URL and a throwaway database.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from history import update_vendor_with_history, update_vendors_with_history  # noqa: E402
+
+COUNTRIES = ["Germany", "India", "United States", "France", "United Kingdom", "Canada"]
+WORDS = ["Acme", "Global", "Nordic", "Summit", "Pioneer", "Vertex", "Harbor", "Atlas"]
+
+
+def open_backend(name, workdir):
+    if name == "sqlite":
+        from storage.sqlite import SQLiteVendorStore
+        return SQLiteVendorStore(Path(workdir) / "bench.db"), None
+    if name == "mongo":
+        from storage.mongo import MongoVendorStore
+        db_name = f"vendordb_bench_{uuid.uuid4().hex[:8]}"
+        url = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+        return MongoVendorStore(url, db_name=db_name), db_name
+    raise ValueError(name)
+
+
+def make_vendor(n, now):
+    word = WORDS[n % len(WORDS)]
+    return {
+        "id": str(uuid.uuid4()),
+        "vendor_id": f"VENDOR{n:06d}",
+        "company_name": f"{word} Supplies {n}",
+        "contact_person": f"Contact {n}",
+        "email": f"contact{n}@{word.lower()}.example.com",
+        "phone": "+1234567890",
+        "street_address": f"{n} Main St",
+        "city": "City",
+        "postal_code": "10115",
+        "country": COUNTRIES[n % len(COUNTRIES)],
+        "bank_name": "Bank",
+        "account_number": str(n),
+        "iban": "DE89370400440532013000",
+        "bic": "COBADEFFXXX",
+        "documents": {},
+        "status": "active" if n % 5 else "inactive",
+        "created_at": now - timedelta(minutes=n),
+        "updated_at": None,
+        "is_deleted": False,
+        "history_seq": 0
+    }
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def run(name, vendors, repeat, workdir):
+    store, db_name = open_backend(name, workdir)
+    store.ensure_schema()
+    now = datetime.utcnow()
+    try:
+        started = time.perf_counter()
+        for n in range(vendors):
+            store.insert_vendor(make_vendor(n, now))
+        load_s = time.perf_counter() - started
+
+        results = {
+            "list page": timed(lambda: store.find_vendors({}, limit=100, offset=0), repeat),
+            "deep page": timed(lambda: store.find_vendors({}, limit=100, offset=vendors // 2), repeat),
+            "count": timed(lambda: store.count_vendors({}), repeat),
+            "filtered": timed(lambda: store.find_vendors({"country": "India", "status": "active"}, limit=100), repeat),
+            "search": timed(lambda: store.find_vendors({"search": "nordic supplies 1"}, limit=100), repeat),
+            "distinct": timed(lambda: store.distinct_values("country"), repeat),
+            "stats": timed(lambda: store.vendor_stats(now - timedelta(days=30)), repeat),
+            "update": timed(lambda: update_vendor_with_history(
+                store, "VENDOR000001", {"city": "Other", "updated_at": datetime.utcnow()}
+            ), repeat),
+        }
+        ids = store.find_vendor_ids({"country": "Canada"})[:1000]
+        before = {v["vendor_id"]: v for v in store.get_vendors_by_ids(ids)}
+        results["batch 1k"] = timed(lambda: update_vendors_with_history(
+            store, before, {"status": "inactive", "updated_at": datetime.utcnow()}
+        ), 1)
+
+        print(f"\n{name}: loaded {vendors} vendors in {load_s:.1f}s ({vendors / load_s:.0f}/s)")
+        for op, ms in results.items():
+            print(f"  {op:>10}: {ms:8.2f}ms")
+    finally:
+        if db_name:
+            store.client.drop_database(db_name)
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Storage backend benchmark")
+    parser.add_argument("--vendors", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backends", default="sqlite")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in args.backends.split(","):
+            run(name, args.vendors, args.repeat, workdir)
+
+
+if __name__ == "__main__":
+    main()
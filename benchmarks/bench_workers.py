@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling benchmark for the multi-worker launcher.
+
+Starts backend/serve.py with 1, 2, 4 and 8 workers against the configured
+MONGO_URL, waits for /api/health/ready, then drives a fixed request mix from
+several client processes and reports requests/second and scaling efficiency
+relative to a single worker.
+
+    python benchmarks/bench_workers.py --duration 15 --path "/api/vendors?limit=20"
+
+Admission limits are per client and every client here connects from
+127.0.0.1, so by default the server is started with ADMISSION_ENABLED=0 to
+measure raw throughput. With --admission each client process sends its own
+key from ADMISSION_API_KEYS instead. Only 200s count towards req/s; shed
+responses (429/503) are reported separately.
+"""
+
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import requests
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SERVE = ROOT_DIR / "backend" / "serve.py"
+
+
+def wait_ready(base_url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/api/health/ready", timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def client_loop(args):
+    url, duration, api_key = args
+    session = requests.Session()
+    headers = {"X-API-Key": api_key} if api_key else {}
+    statuses = Counter()
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        statuses[session.get(url, headers=headers, timeout=10).status_code] += 1
+    return statuses
+
+
+def run_level(workers, port, path, duration, clients, admission):
+    base_url = f"http://127.0.0.1:{port}"
+    api_keys = [f"bench-{n}" for n in range(clients)] if admission else [None] * clients
+    env = dict(os.environ)
+    if admission:
+        env["ADMISSION_ENABLED"] = "1"
+        env["ADMISSION_API_KEYS"] = ",".join(api_keys)
+    else:
+        env["ADMISSION_ENABLED"] = "0"
+    server = subprocess.Popen(
+        [sys.executable, str(SERVE), "--workers", str(workers), "--port", str(port), "--host", "127.0.0.1"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        if not wait_ready(base_url):
+            raise RuntimeError(f"server with {workers} workers did not become ready")
+        with multiprocessing.Pool(clients) as pool:
+            results = pool.map(client_loop, [(base_url + path, duration, key) for key in api_keys])
+        return sum(results, Counter())
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", default="1,2,4,8")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--path", default="/api/vendors?limit=20")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=32, help="Client processes issuing requests")
+    parser.add_argument(
+        "--admission", action="store_true",
+        help="keep admission control on and give each client process its own API key"
+    )
+    args = parser.parse_args()
+
+    baseline = base_workers = None
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8} {'efficiency':>10} {'429':>8} {'503':>8} {'other':>8}")
+    for workers in [int(level) for level in args.levels.split(",")]:
+        statuses = run_level(workers, args.port, args.path, args.duration, args.clients, args.admission)
+        rps = statuses[200] / args.duration
+        other = sum(statuses.values()) - statuses[200] - statuses[429] - statuses[503]
+        if baseline is None:
+            baseline, base_workers = rps, workers
+        speedup = rps / baseline if baseline else 0.0
+        efficiency = speedup / (workers / base_workers)
+        print(
+            f"{workers:>8} {rps:>10.1f} {speedup:>8.2f} {efficiency:>10.0%} "
+            f"{statuses[429]:>8} {statuses[503]:>8} {other:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
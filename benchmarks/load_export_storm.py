@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Export storm load test for admission control.
+
+Against a running server, measures interactive read latency (vendor detail
+and list pages) first on its own, then while many clients hammer the CSV
+export endpoint. With admission control the interactive p99 should stay
+close to the quiet baseline while excess exports are shed with 429/503.
+
+    python benchmarks/load_export_storm.py --base-url http://127.0.0.1:8001 --duration 20
+
+Rate limits are per client IP unless a request carries one of the server's
+ADMISSION_API_KEYS. To model many exporting clients from one machine, start
+the server with ADMISSION_API_KEYS=storm-0,storm-1,... and pass the same keys
+with --api-keys; without keys all exporters share one client's bucket.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from collections import Counter
+
+import requests
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def interactive_client(base_url, vendor_ids, stop, latencies, interactive_statuses):
+    session = requests.Session()
+    paths = [f"/api/vendors/{vid}" for vid in vendor_ids] + ["/api/vendors?limit=20"]
+    i = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = session.get(base_url + paths[i % len(paths)], timeout=30)
+        interactive_statuses[response.status_code] += 1
+        # Shed responses are fast by design; only served requests count
+        if response.ok:
+            latencies.append(time.perf_counter() - started)
+        else:
+            time.sleep(float(response.headers.get("Retry-After", "0")) or 0.1)
+        i += 1
+
+
+def export_client(base_url, api_key, stop, statuses):
+    session = requests.Session()
+    headers = {"X-API-Key": api_key} if api_key else {}
+    while not stop.is_set():
+        response = session.get(f"{base_url}/api/vendors/export/csv", headers=headers, timeout=300)
+        statuses[response.status_code] += 1
+        if response.status_code in (429, 503):
+            time.sleep(float(response.headers.get("Retry-After", "1")))
+
+
+def run_phase(base_url, vendor_ids, duration, interactive, exporters, api_keys):
+    stop = threading.Event()
+    latencies = []
+    interactive_statuses = Counter()
+    statuses = Counter()
+    threads = [
+        threading.Thread(target=interactive_client, args=(base_url, vendor_ids, stop, latencies, interactive_statuses))
+        for _ in range(interactive)
+    ] + [
+        threading.Thread(target=export_client, args=(base_url, api_keys[n % len(api_keys)] if api_keys else None, stop, statuses))
+        for n in range(exporters)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, interactive_statuses, statuses
+
+
+def report(name, latencies, interactive_statuses, statuses):
+    ms = [s * 1000 for s in latencies]
+    print(
+        f"{name:>10}: n={len(ms):6d}  p50={statistics.median(ms):7.1f}ms  "
+        f"p99={percentile(ms, 99):7.1f}ms  max={max(ms):7.1f}ms  "
+        f"interactive statuses={dict(interactive_statuses)}  export statuses={dict(statuses)}"
+    )
+    return percentile(ms, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interactive latency under an export storm")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8001")
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--interactive", type=int, default=8)
+    parser.add_argument("--exporters", type=int, default=32)
+    parser.add_argument(
+        "--api-keys", default="",
+        help="comma separated keys from the server's ADMISSION_API_KEYS, spread over the exporters"
+    )
+    args = parser.parse_args()
+    api_keys = [key.strip() for key in args.api_keys.split(",") if key.strip()]
+
+    vendors = requests.get(f"{args.base_url}/api/vendors?limit=50", timeout=30).json()["vendors"]
+    vendor_ids = [v["vendor_id"] for v in vendors] or ["VENDOR001"]
+
+    quiet = report("quiet", *run_phase(args.base_url, vendor_ids, args.duration, args.interactive, 0, api_keys))
+    storm = report("storm", *run_phase(args.base_url, vendor_ids, args.duration, args.interactive, args.exporters, api_keys))
+    print(f"interactive p99 under storm: {storm / quiet:.2f}x quiet baseline")
+    print(requests.get(f"{args.base_url}/api/admission/stats", timeout=10).json())
+
+
+if __name__ == "__main__":
+    main()
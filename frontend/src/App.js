@@ -1,70 +1,12 @@
-<<<<<<< HEAD
-import React, { useState } from "react";
-import "./App.css";
-import { BrowserRouter, Routes, Route } from "react-router-dom";
-import { Toaster } from './components/ui/toaster';
-import MaterialDashboard from './components/MaterialCreation/MaterialDashboard';
-import MaterialList from './components/MaterialCreation/MaterialList';
-import MaterialForm from './components/MaterialCreation/MaterialForm';
-import { Button } from './components/ui/button';
-import { Card, CardContent, CardHeader, CardTitle } from './components/ui/card';
-import { 
-  Package, 
-  Plus, 
-  List, 
-  BarChart3, 
-  ArrowLeft,
-  Settings,
-  Home
-} from 'lucide-react';
-
-const Navigation = ({ currentView, onViewChange }) => {
-  const navItems = [
-    { id: 'dashboard', label: 'Dashboard', icon: BarChart3 },
-    { id: 'list', label: 'Materials', icon: List },
-    { id: 'create', label: 'Create', icon: Plus }
-  ];
-
-  return (
-    <div className="bg-white dark:bg-gray-900 border-b border-border">
-      <div className="max-w-7xl mx-auto px-6 py-4">
-        <div className="flex items-center justify-between">
-          <div className="flex items-center space-x-6">
-            <div className="flex items-center space-x-2">
-              <Package className="h-8 w-8 text-primary" />
-              <h1 className="text-2xl font-bold">MaterialPro</h1>
-            </div>
-            <div className="flex items-center space-x-1">
-              {navItems.map(item => {
-                const Icon = item.icon;
-                return (
-                  <Button
-                    key={item.id}
-                    variant={currentView === item.id ? "default" : "ghost"}
-                    onClick={() => onViewChange(item.id)}
-                    className="flex items-center gap-2"
-                  >
-                    <Icon className="h-4 w-4" />
-                    {item.label}
-                  </Button>
-                );
-              })}
-            </div>
-          </div>
-          <div className="flex items-center space-x-2">
-            <Button variant="outline" size="sm">
-              <Settings className="h-4 w-4" />
-            </Button>
-=======
 import React, { useState, useEffect } from 'react';
 import './App.css';
+import { useVendorList } from './hooks/use-vendor-list';
+import VirtualVendorList from './components/VendorList/VirtualVendorList';
 
 const API_BASE_URL = process.env.REACT_APP_BACKEND_URL || 'http://localhost:8001';
 
 function App() {
   const [currentStep, setCurrentStep] = useState(1);
-  const [vendors, setVendors] = useState([]);
-  const [filteredVendors, setFilteredVendors] = useState([]);
   const [showForm, setShowForm] = useState(false);
   const [editingVendor, setEditingVendor] = useState(null);
   const [nextVendorId, setNextVendorId] = useState('');
@@ -72,9 +14,15 @@ function App() {
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCountry, setSelectedCountry] = useState('');
   const [selectedStatus, setSelectedStatus] = useState('');
-  const [filterOptions, setFilterOptions] = useState({ countries: [], statuses: [] });
   const [stats, setStats] = useState({});
 
+  const vendorList = useVendorList(API_BASE_URL, {
+    search: searchTerm,
+    country: selectedCountry,
+    status: selectedStatus
+  });
+  const { filterOptions } = vendorList;
+
   const [formData, setFormData] = useState({
     company_name: '',
     contact_person: '',
@@ -103,30 +51,9 @@ function App() {
   ];
 
   useEffect(() => {
-    fetchVendors();
     fetchStats();
   }, []);
 
-  useEffect(() => {
-    filterVendors();
-  }, [vendors, searchTerm, selectedCountry, selectedStatus]);
-
-  const fetchVendors = async () => {
-    try {
-      setLoading(true);
-      const response = await fetch(`${API_BASE_URL}/api/vendors`);
-      if (response.ok) {
-        const data = await response.json();
-        setVendors(data.vendors);
-        setFilterOptions(data.filter_options);
-      }
-    } catch (error) {
-      console.error('Failed to fetch vendors:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   const fetchStats = async () => {
     try {
       const response = await fetch(`${API_BASE_URL}/api/vendors/stats`);
@@ -139,30 +66,27 @@ function App() {
     }
   };
 
-  const filterVendors = () => {
-    let filtered = vendors;
-
-    // Search filter
-    if (searchTerm) {
-      filtered = filtered.filter(vendor => 
-        vendor.vendor_id.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        vendor.company_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        vendor.contact_person.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        vendor.email.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    // Country filter
-    if (selectedCountry) {
-      filtered = filtered.filter(vendor => vendor.country === selectedCountry);
-    }
-
-    // Status filter
-    if (selectedStatus) {
-      filtered = filtered.filter(vendor => vendor.status === selectedStatus);
-    }
-
-    setFilteredVendors(filtered);
+  // Keeps the stat cards in step with a mutation without refetching them
+  const adjustStats = (before, after) => {
+    const recentSince = Date.now() - 30 * 24 * 60 * 60 * 1000;
+    setStats(prev => {
+      // Until the stats have loaded there is nothing to adjust; deltas on an
+      // empty object would show as totals. The pending fetch has the mutation.
+      if (prev.total_vendors === undefined) return prev;
+      const next = { ...prev };
+      const count = (vendor, delta) => {
+        if (!vendor) return;
+        next.total_vendors += delta;
+        if (vendor.status === 'active') next.active_vendors += delta;
+        if (vendor.status === 'inactive') next.inactive_vendors += delta;
+        if (new Date(vendor.created_at).getTime() >= recentSince) {
+          next.recent_vendors += delta;
+        }
+      };
+      count(before, -1);
+      count(after, 1);
+      return next;
+    });
   };
 
   const fetchNextVendorId = async () => {
@@ -306,9 +230,9 @@ function App() {
       if (response.ok) {
         const result = await response.json();
         alert(editingVendor ? 'Vendor updated successfully!' : 'Vendor created successfully!');
+        adjustStats(editingVendor && vendorList.getVendor(editingVendor.vendor_id), result.vendor);
+        vendorList.upsertVendor(result.vendor);
         resetForm();
-        fetchVendors();
-        fetchStats();
         setShowForm(false);
       } else {
         const error = await response.json();
@@ -383,8 +307,8 @@ function App() {
         });
         if (response.ok) {
           alert('Vendor deleted successfully!');
-          fetchVendors();
-          fetchStats();
+          adjustStats(vendorList.getVendor(vendorId), null);
+          vendorList.removeVendor(vendorId);
         } else {
           alert('Failed to delete vendor');
         }
@@ -676,176 +600,11 @@ function App() {
             <label htmlFor="msme" className="upload-button">
               {formData.documents.msme ? formData.documents.msme : 'Choose File'}
             </label>
->>>>>>> venor/main
           </div>
         </div>
       </div>
     </div>
   );
-<<<<<<< HEAD
-};
-
-const WelcomeScreen = ({ onGetStarted }) => {
-  return (
-    <div className="min-h-screen bg-gradient-to-br from-blue-50 via-white to-indigo-50 dark:from-gray-900 dark:via-gray-800 dark:to-gray-900">
-      <div className="flex items-center justify-center min-h-screen p-6">
-        <Card className="max-w-2xl w-full shadow-2xl">
-          <CardHeader className="text-center pb-4">
-            <div className="flex justify-center mb-4">
-              <div className="p-4 bg-gradient-to-br from-blue-500 to-indigo-600 rounded-2xl shadow-lg">
-                <Package className="h-12 w-12 text-white" />
-              </div>
-            </div>
-            <CardTitle className="text-3xl font-bold bg-gradient-to-r from-blue-600 to-indigo-600 bg-clip-text text-transparent">
-              Welcome to MaterialPro
-            </CardTitle>
-            <p className="text-muted-foreground text-lg mt-2">
-              Complete Manufacturing Material Creation & Management System
-            </p>
-          </CardHeader>
-          <CardContent className="space-y-6">
-            <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
-              <div className="text-center p-4 bg-blue-50 dark:bg-blue-950/20 rounded-lg">
-                <Package className="h-8 w-8 mx-auto mb-2 text-blue-600" />
-                <h3 className="font-semibold">Raw Materials</h3>
-                <p className="text-sm text-muted-foreground">Manage raw material inventory</p>
-              </div>
-              <div className="text-center p-4 bg-yellow-50 dark:bg-yellow-950/20 rounded-lg">
-                <Settings className="h-8 w-8 mx-auto mb-2 text-yellow-600" />
-                <h3 className="font-semibold">Semi-Finished</h3>
-                <p className="text-sm text-muted-foreground">Track production stages</p>
-              </div>
-              <div className="text-center p-4 bg-green-50 dark:bg-green-950/20 rounded-lg">
-                <BarChart3 className="h-8 w-8 mx-auto mb-2 text-green-600" />
-                <h3 className="font-semibold">Finished Products</h3>
-                <p className="text-sm text-muted-foreground">Complete product management</p>
-              </div>
-            </div>
-
-            <div className="space-y-4">
-              <h3 className="font-semibold text-lg">Key Features:</h3>
-              <div className="grid grid-cols-1 md:grid-cols-2 gap-3 text-sm">
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-blue-500 rounded-full"></div>
-                  <span>Multi-level material hierarchy</span>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-green-500 rounded-full"></div>
-                  <span>Plant & warehouse management</span>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-purple-500 rounded-full"></div>
-                  <span>MRP integration</span>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-orange-500 rounded-full"></div>
-                  <span>Batch & serial tracking</span>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-red-500 rounded-full"></div>
-                  <span>Real-time analytics</span>
-                </div>
-                <div className="flex items-center space-x-2">
-                  <div className="w-2 h-2 bg-teal-500 rounded-full"></div>
-                  <span>Industry-specific configurations</span>
-                </div>
-              </div>
-            </div>
-
-            <div className="flex justify-center pt-4">
-              <Button 
-                onClick={onGetStarted}
-                size="lg"
-                className="px-8 py-3 text-lg bg-gradient-to-r from-blue-600 to-indigo-600 hover:from-blue-700 hover:to-indigo-700"
-              >
-                <Home className="h-5 w-5 mr-2" />
-                Get Started
-              </Button>
-            </div>
-          </CardContent>
-        </Card>
-      </div>
-    </div>
-  );
-};
-
-const MainApp = () => {
-  const [currentView, setCurrentView] = useState('dashboard');
-  const [editingMaterial, setEditingMaterial] = useState(null);
-
-  const handleCreateNew = () => {
-    setEditingMaterial(null);
-    setCurrentView('create');
-  };
-
-  const handleEdit = (material) => {
-    setEditingMaterial(material);
-    setCurrentView('create');
-  };
-
-  const handleSave = () => {
-    setEditingMaterial(null);
-    setCurrentView('list');
-  };
-
-  const handleCancel = () => {
-    setEditingMaterial(null);
-    setCurrentView('list');
-  };
-
-  const renderContent = () => {
-    switch (currentView) {
-      case 'dashboard':
-        return <MaterialDashboard />;
-      case 'list':
-        return (
-          <MaterialList 
-            onCreateNew={handleCreateNew}
-            onEdit={handleEdit}
-          />
-        );
-      case 'create':
-        return (
-          <MaterialForm
-            material={editingMaterial}
-            mode={editingMaterial ? 'edit' : 'create'}
-            onSave={handleSave}
-            onCancel={handleCancel}
-          />
-        );
-      default:
-        return <MaterialDashboard />;
-    }
-  };
-
-  return (
-    <div className="min-h-screen bg-background">
-      <Navigation 
-        currentView={currentView} 
-        onViewChange={setCurrentView}
-      />
-      <main className="py-6">
-        {renderContent()}
-      </main>
-      <Toaster />
-    </div>
-  );
-};
-
-function App() {
-  const [showWelcome, setShowWelcome] = useState(true);
-
-  if (showWelcome) {
-    return <WelcomeScreen onGetStarted={() => setShowWelcome(false)} />;
-  }
-
-  return (
-    <BrowserRouter>
-      <Routes>
-        <Route path="/*" element={<MainApp />} />
-      </Routes>
-    </BrowserRouter>
-=======
 
   const renderReview = () => (
     <div className="form-section">
@@ -957,6 +716,45 @@ function App() {
     </div>
   );
 
+  const renderVendorCard = (vendor) => (
+    <div className="vendor-card">
+      <div className="vendor-header">
+        <h3>{vendor.company_name}</h3>
+        <span className="vendor-id">{vendor.vendor_id}</span>
+      </div>
+      <div className="vendor-details">
+        <p><strong>Contact:</strong> {vendor.contact_person}</p>
+        <p><strong>Email:</strong> {vendor.email}</p>
+        <p><strong>Phone:</strong> {vendor.phone}</p>
+        <p><strong>Location:</strong> {vendor.city}, {vendor.country}</p>
+        <p><strong>Bank:</strong> {vendor.bank_name}</p>
+      </div>
+      <div className="vendor-status">
+        <span className={`status ${vendor.status}`}>{vendor.status}</span>
+        <span className="date">
+          {vendor.updated_at ? 'Updated' : 'Created'}: {' '}
+          {new Date(vendor.updated_at || vendor.created_at).toLocaleDateString()}
+        </span>
+      </div>
+      <div className="vendor-actions">
+        <button 
+          className="btn-edit" 
+          onClick={() => startEditing(vendor)}
+        >
+          Edit
+        </button>
+        <button 
+          className="btn-delete" 
+          onClick={() => handleDelete(vendor.vendor_id)}
+        >
+          Delete
+        </button>
+      </div>
+    </div>
+  );
+
+  const hasFilters = Boolean(searchTerm || selectedCountry || selectedStatus);
+
   if (showForm) {
     return (
       <div className="app">
@@ -1018,20 +816,20 @@ function App() {
         <div className="vendors-grid">
           <div className="vendors-header">
             <h2>
-              Vendors ({filteredVendors.length} of {vendors.length})
-              {(searchTerm || selectedCountry || selectedStatus) && (
+              Vendors ({vendorList.ids.length} of {vendorList.totalCount})
+              {hasFilters && (
                 <span className="filter-indicator">Filtered</span>
               )}
             </h2>
           </div>
           
-          {loading ? (
+          {vendorList.ids.length === 0 && vendorList.loading ? (
             <div className="loading-state">
               <p>Loading vendors...</p>
             </div>
-          ) : filteredVendors.length === 0 ? (
+          ) : vendorList.ids.length === 0 ? (
             <div className="empty-state">
-              {vendors.length === 0 ? (
+              {!hasFilters ? (
                 <>
                   <h3>No vendors yet</h3>
                   <p>Start by onboarding your first vendor</p>
@@ -1050,49 +848,17 @@ function App() {
               )}
             </div>
           ) : (
-            <div className="vendors-list">
-              {filteredVendors.map((vendor) => (
-                <div key={vendor.id} className="vendor-card">
-                  <div className="vendor-header">
-                    <h3>{vendor.company_name}</h3>
-                    <span className="vendor-id">{vendor.vendor_id}</span>
-                  </div>
-                  <div className="vendor-details">
-                    <p><strong>Contact:</strong> {vendor.contact_person}</p>
-                    <p><strong>Email:</strong> {vendor.email}</p>
-                    <p><strong>Phone:</strong> {vendor.phone}</p>
-                    <p><strong>Location:</strong> {vendor.city}, {vendor.country}</p>
-                    <p><strong>Bank:</strong> {vendor.bank_name}</p>
-                  </div>
-                  <div className="vendor-status">
-                    <span className={`status ${vendor.status}`}>{vendor.status}</span>
-                    <span className="date">
-                      {vendor.updated_at ? 'Updated' : 'Created'}: {' '}
-                      {new Date(vendor.updated_at || vendor.created_at).toLocaleDateString()}
-                    </span>
-                  </div>
-                  <div className="vendor-actions">
-                    <button 
-                      className="btn-edit" 
-                      onClick={() => startEditing(vendor)}
-                    >
-                      Edit
-                    </button>
-                    <button 
-                      className="btn-delete" 
-                      onClick={() => handleDelete(vendor.vendor_id)}
-                    >
-                      Delete
-                    </button>
-                  </div>
-                </div>
-              ))}
-            </div>
+            <VirtualVendorList
+              ids={vendorList.ids}
+              getVendor={vendorList.getVendor}
+              renderVendor={renderVendorCard}
+              onEndReached={vendorList.loadMore}
+              resetKey={vendorList.queryKey}
+            />
           )}
         </div>
       </div>
     </div>
->>>>>>> venor/main
   );
 }
 
@@ -0,0 +1,78 @@
+import React, { useEffect, useLayoutEffect, useRef, useState } from 'react';
+
+// Windowed vendor grid: only the rows inside the viewport (plus OVERSCAN_ROWS
+// on each side) are mounted, so the DOM stays small however many vendors are
+// loaded. Rows have a fixed height and the column count follows the width.
+
+const ROW_HEIGHT = 340;
+const MIN_COLUMN_WIDTH = 350;
+const GAP = 20;
+const OVERSCAN_ROWS = 2;
+const LOAD_MORE_ROWS = 5;
+
+const VirtualVendorList = ({ ids, getVendor, renderVendor, onEndReached, resetKey }) => {
+  const viewportRef = useRef(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [size, setSize] = useState({ width: 0, height: 0 });
+
+  useLayoutEffect(() => {
+    const viewport = viewportRef.current;
+    const measure = () => setSize({ width: viewport.clientWidth, height: viewport.clientHeight });
+    measure();
+    const observer = new ResizeObserver(measure);
+    observer.observe(viewport);
+    return () => observer.disconnect();
+  }, []);
+
+  useEffect(() => {
+    // A new query starts at the top
+    viewportRef.current.scrollTop = 0;
+    setScrollTop(0);
+  }, [resetKey]);
+
+  const columns = Math.max(1, Math.floor((size.width + GAP) / (MIN_COLUMN_WIDTH + GAP)));
+  const rowStride = ROW_HEIGHT + GAP;
+  const rowCount = Math.ceil(ids.length / columns);
+  const firstRow = Math.max(0, Math.floor(scrollTop / rowStride) - OVERSCAN_ROWS);
+  const lastRow = Math.min(rowCount - 1, Math.ceil((scrollTop + size.height) / rowStride) + OVERSCAN_ROWS);
+
+  useEffect(() => {
+    if (size.height && lastRow >= rowCount - LOAD_MORE_ROWS) {
+      onEndReached();
+    }
+  }, [lastRow, rowCount, size.height, onEndReached]);
+
+  const rows = [];
+  for (let row = firstRow; row <= lastRow; row++) {
+    const rowIds = ids.slice(row * columns, (row + 1) * columns);
+    rows.push(
+      <div
+        key={row}
+        className="vendors-window-row"
+        style={{
+          top: row * rowStride,
+          height: ROW_HEIGHT,
+          gridTemplateColumns: `repeat(${columns}, minmax(0, 1fr))`
+        }}
+      >
+        {rowIds.map(vendorId => (
+          <React.Fragment key={vendorId}>{renderVendor(getVendor(vendorId))}</React.Fragment>
+        ))}
+      </div>
+    );
+  }
+
+  return (
+    <div
+      ref={viewportRef}
+      className="vendors-viewport"
+      onScroll={(e) => setScrollTop(e.currentTarget.scrollTop)}
+    >
+      <div className="vendors-window" style={{ height: Math.max(0, rowCount * rowStride - GAP) }}>
+        {rows}
+      </div>
+    </div>
+  );
+};
+
+export default VirtualVendorList;
@@ -0,0 +1,144 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+
+// Incrementally loaded vendor list
+//
+// Pages of PAGE_SIZE vendors are fetched from /api/vendors as the list is
+// scrolled. Vendors are kept in a normalized cache keyed by vendor_id, and the
+// current query only holds the ordered ids, so mutation responses can be
+// applied in place instead of refetching. Search input is debounced and any
+// request that is superseded by a newer query is aborted.
+
+const PAGE_SIZE = 100;
+const SEARCH_DEBOUNCE_MS = 300;
+// Fields the server's `search` filter looks at
+const SEARCH_FIELDS = ['vendor_id', 'company_name', 'contact_person', 'email'];
+
+// Client-side copy of the /api/vendors filters: literal, case-insensitive
+// substring search plus exact country and status
+function matchesQuery(vendor, { search, country, status }) {
+  if (vendor.is_deleted) return false;
+  if (country && vendor.country !== country) return false;
+  if (status && vendor.status !== status) return false;
+  if (!search) return true;
+  const term = search.toLowerCase();
+  return SEARCH_FIELDS.some(field => String(vendor[field] || '').toLowerCase().includes(term));
+}
+
+export function useVendorList(apiBaseUrl, { search, country, status }) {
+  const vendorsById = useRef(new Map());
+  const ids = useRef([]);
+  const listed = useRef(new Set());
+  const controller = useRef(null);
+  const [, setVersion] = useState(0);
+  const [totalCount, setTotalCount] = useState(0);
+  const [filterOptions, setFilterOptions] = useState({ countries: [], statuses: [] });
+  const [loading, setLoading] = useState(false);
+  const [debouncedSearch, setDebouncedSearch] = useState(search.trim());
+
+  const refresh = () => setVersion(version => version + 1);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(search.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [search]);
+
+  const fetchPage = useCallback(async (offset, reset) => {
+    if (reset) {
+      controller.current?.abort();
+    } else if (controller.current) {
+      // A page for this query is already on its way
+      return;
+    }
+    const request = new AbortController();
+    controller.current = request;
+
+    const params = new URLSearchParams({ limit: PAGE_SIZE, offset });
+    if (debouncedSearch) params.append('search', debouncedSearch);
+    if (country) params.append('country', country);
+    if (status) params.append('status', status);
+
+    setLoading(true);
+    try {
+      const response = await fetch(`${apiBaseUrl}/api/vendors?${params}`, { signal: request.signal });
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      const data = await response.json();
+      if (reset) {
+        ids.current = [];
+        listed.current = new Set();
+      }
+      data.vendors.forEach(vendor => {
+        vendorsById.current.set(vendor.vendor_id, vendor);
+        // Writes between page loads shift offsets, so pages can overlap
+        if (!listed.current.has(vendor.vendor_id)) {
+          listed.current.add(vendor.vendor_id);
+          ids.current.push(vendor.vendor_id);
+        }
+      });
+      setTotalCount(data.total_count);
+      setFilterOptions(data.filter_options);
+      refresh();
+    } catch (error) {
+      if (error.name !== 'AbortError') {
+        console.error('Failed to fetch vendors:', error);
+      }
+    } finally {
+      if (controller.current === request) {
+        controller.current = null;
+        setLoading(false);
+      }
+    }
+  }, [apiBaseUrl, debouncedSearch, country, status]);
+
+  useEffect(() => {
+    fetchPage(0, true);
+    return () => controller.current?.abort();
+  }, [fetchPage]);
+
+  const loadMore = useCallback(() => {
+    if (!controller.current && ids.current.length < totalCount) {
+      fetchPage(ids.current.length, false);
+    }
+  }, [fetchPage, totalCount]);
+
+  const getVendor = useCallback(vendorId => vendorsById.current.get(vendorId), []);
+
+  const upsertVendor = useCallback(vendor => {
+    vendorsById.current.set(vendor.vendor_id, vendor);
+    const matches = matchesQuery(vendor, { search: debouncedSearch, country, status });
+    if (matches && !listed.current.has(vendor.vendor_id)) {
+      // New vendors sort first (newest created_at)
+      listed.current.add(vendor.vendor_id);
+      ids.current = [vendor.vendor_id, ...ids.current];
+      setTotalCount(count => count + 1);
+    } else if (!matches && listed.current.delete(vendor.vendor_id)) {
+      // An edit moved the vendor out of the current query
+      ids.current = ids.current.filter(id => id !== vendor.vendor_id);
+      setTotalCount(count => Math.max(0, count - 1));
+    }
+    refresh();
+  }, [debouncedSearch, country, status]);
+
+  const removeVendor = useCallback(vendorId => {
+    vendorsById.current.delete(vendorId);
+    if (listed.current.delete(vendorId)) {
+      ids.current = ids.current.filter(id => id !== vendorId);
+      setTotalCount(count => Math.max(0, count - 1));
+    }
+    refresh();
+  }, []);
+
+  return {
+    queryKey: `${debouncedSearch}|${country}|${status}`,
+    ids: ids.current,
+    getVendor,
+    totalCount,
+    filterOptions,
+    loading,
+    hasMore: ids.current.length < totalCount,
+    loadMore,
+    upsertVendor,
+    removeVendor
+  };
+}
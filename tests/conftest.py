@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Backend modules are imported the same way uvicorn loads them (from backend/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,113 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from admission import (
+    AdmissionController,
+    PriorityGate,
+    RouteClass,
+    Shed,
+    TokenBucket,
+    classify_request,
+    client_key_from_scope,
+)
+
+
+def test_classify_request():
+    assert classify_request("GET", "/api/vendors/export/csv", b"") == "bulk"
+    assert classify_request("PATCH", "/api/vendors/batch", b"") == "bulk"
+    assert classify_request("GET", "/api/vendors/exports/abc/download", b"") == "download"
+    assert classify_request("POST", "/api/vendors/exports", b"") == "bulk"
+    assert classify_request("GET", "/api/vendors/exports/abc", b"") == "interactive"
+    assert classify_request("GET", "/api/vendors/stats", b"") == "stats"
+    assert classify_request("GET", "/api/vendors", b"search=acme&limit=20") == "search"
+    assert classify_request("GET", "/api/vendors", b"limit=20") == "interactive"
+    assert classify_request("GET", "/api/vendors/VENDOR001", b"") == "interactive"
+    assert classify_request("GET", "/api/health/ready", b"") is None
+
+
+def test_token_bucket_reports_wait_when_empty():
+    bucket = TokenBucket(rate=1, burst=2)
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert 0 < bucket.take() <= 1
+
+
+def test_gate_serves_higher_priority_waiters_first():
+    async def scenario():
+        gate = PriorityGate(max_concurrent=1, max_queue=10)
+        await gate.acquire(priority=0, timeout=1)
+        order = []
+
+        async def worker(name, priority):
+            await gate.acquire(priority, timeout=1)
+            order.append(name)
+            gate.release()
+
+        tasks = [asyncio.create_task(worker("bulk", 3))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(worker("interactive", 0)))
+        await asyncio.sleep(0)
+        gate.release()
+        await asyncio.gather(*tasks)
+        return order, gate.in_flight
+
+    order, in_flight = asyncio.run(scenario())
+    assert order == ["interactive", "bulk"]
+    assert in_flight == 0
+
+
+def test_controller_sheds_when_queue_full_and_rate_limited():
+    classes = {
+        "bulk": RouteClass("bulk", 3, max_concurrent=1, max_queue=0, rate=100, burst=100),
+        "stats": RouteClass("stats", 2, max_concurrent=5, max_queue=5, rate=0.1, burst=1),
+    }
+
+    async def scenario():
+        controller = AdmissionController(classes)
+        await controller.admit("bulk", "ip:a")
+        with pytest.raises(Shed) as queue_full:
+            await controller.admit("bulk", "ip:b")
+        await controller.admit("stats", "ip:a")
+        with pytest.raises(Shed) as rate_limited:
+            await controller.admit("stats", "ip:a")
+        return controller.snapshot(), queue_full.value, rate_limited.value
+
+    snapshot, queue_full, rate_limited = asyncio.run(scenario())
+    assert queue_full.status_code == 503
+    assert rate_limited.status_code == 429 and rate_limited.retry_after > 0
+    assert snapshot["classes"]["bulk"]["shed_queue_full"] == 1
+    assert snapshot["classes"]["stats"]["shed_rate_limited"] == 1
+
+
+def test_client_key_only_honours_known_api_keys():
+    def scope(api_key):
+        return {"headers": [(b"x-api-key", api_key)], "client": ("10.0.0.1", 5000)}
+
+    api_keys = frozenset({"partner-1"})
+    assert client_key_from_scope(scope(b"partner-1"), api_keys) == "key:partner-1"
+    # Made-up keys do not get their own rate limit buckets
+    assert client_key_from_scope(scope(b"storm-7"), api_keys) == "ip:10.0.0.1"
+    assert client_key_from_scope(scope(b"partner-1")) == "ip:10.0.0.1"
+
+
+def test_limits_can_be_overridden_per_class_from_the_environment():
+    env = dict(os.environ, ADMISSION_SEARCH_RATE="20", ADMISSION_BULK_MAX_CONCURRENT="1", ADMISSION_ENABLED="off")
+    code = (
+        "import admission as a; "
+        "print(a.ROUTE_CLASSES['search'].rate, a.ROUTE_CLASSES['search'].burst, "
+        "a.ROUTE_CLASSES['bulk'].max_concurrent, a.ADMISSION_ENABLED)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent / "backend",
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["20.0", "20", "1", "False"]
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from exports import ExportJobManager
+from reference_data import REFERENCE_DIR, ReferenceDataLoader
+from storage.sqlite import SQLiteVendorStore
+
+# The API end to end on an embedded SQLite store; no services needed
+
+
+def vendor_payload(**overrides):
+    payload = {
+        "company_name": "Acme Industrial",
+        "contact_person": "Jo Smith",
+        "email": "jo@acme.io",
+        "phone": "+49 30 1234567",
+        "street_address": "1 Main St",
+        "city": "Berlin",
+        "postal_code": "10115",
+        "country": "Germany",
+        "bank_name": "Commerzbank",
+        "account_number": "123",
+        "iban": "DE89370400440532013000",
+        "bic": "COBADEFFXXX"
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "open_store", lambda: SQLiteVendorStore(tmp_path / "vendors.db"))
+    monkeypatch.setattr(server, "ExportJobManager", lambda store: ExportJobManager(store, tmp_path / "exports"))
+    with TestClient(server.app) as client:
+        yield client
+
+
+def create_vendor(client, **overrides) -> dict:
+    response = client.post("/api/vendors", json=vendor_payload(**overrides))
+    assert response.status_code == 200, response.text
+    return response.json()["vendor"]
+
+
+def test_fixed_vendor_paths_are_not_captured_by_vendor_id(client):
+    create_vendor(client)
+    stats = client.get("/api/vendors/stats")
+    assert stats.status_code == 200
+    assert stats.json()["total_vendors"] == 1
+    export = client.get("/api/vendors/export/csv")
+    assert export.status_code == 200
+    assert export.text.splitlines()[1].startswith("VENDOR001,Acme Industrial")
+
+
+def test_batch_patch_logs_every_vendor_in_one_write(client, monkeypatch):
+    import history
+    monkeypatch.setattr(history, "SNAPSHOT_INTERVAL", 2)
+    # Three batches in a row are more than the bulk class's burst allows
+    monkeypatch.setattr(server.admission.rate_limiter, "check", lambda client_key, route_class: None)
+    vendor_ids = [create_vendor(client, email=f"jo{n}@acme.io")["vendor_id"] for n in range(3)]
+    writes = []
+    bulk_update_vendors = server.store.bulk_update_vendors
+
+    def recording_bulk_update(*args):
+        writes.append(args)
+        return bulk_update_vendors(*args)
+    monkeypatch.setattr(server.store, "bulk_update_vendors", recording_bulk_update)
+
+    for status in ("inactive", "active"):
+        response = client.patch("/api/vendors/batch", json={
+            "vendor_ids": vendor_ids + ["VENDOR999"], "update": {"status": status}
+        })
+        assert response.status_code == 200, response.text
+        assert response.json()["summary"] == {
+            "requested": 4, "updated": 3, "unchanged": 0, "not_found": 1, "conflict": 0
+        }
+    unchanged = client.patch("/api/vendors/batch", json={"vendor_ids": vendor_ids, "update": {"status": "active"}})
+    assert unchanged.json()["summary"]["unchanged"] == 3
+    bad_filter = client.patch("/api/vendors/batch", json={
+        "filter": {"created_after": "01/02/2024"}, "update": {"status": "inactive"}
+    })
+    assert bad_filter.status_code == 400, bad_filter.text
+
+    # One store write per batch carries the updates, change entries and snapshots
+    assert len(writes) == 2
+    assert all(len(history_records) == 3 for _, _, history_records in writes)
+    snapshots = server.store.conn.execute("SELECT vendor_id, seq FROM vendor_snapshots ORDER BY vendor_id, seq")
+    assert [tuple(row) for row in snapshots] == [(vendor_id, seq) for vendor_id in vendor_ids for seq in (0, 2)]
+    changes = client.get(f"/api/vendors/{vendor_ids[0]}/history").json()["changes"]
+    assert [(c["seq"], c["changes"]["status"]) for c in changes] == [(2, ["inactive", "active"]), (1, ["active", "inactive"])]
+
+
+def test_history_and_as_of_reads(client):
+    vendor = create_vendor(client)
+    vendor_id = vendor["vendor_id"]
+    response = client.put(f"/api/vendors/{vendor_id}", json={"city": "Munich"})
+    assert response.status_code == 200, response.text
+
+    changes = client.get(f"/api/vendors/{vendor_id}/history").json()["changes"]
+    assert [(c["seq"], c["changes"]["city"]) for c in changes] == [(1, ["Berlin", "Munich"])]
+    created_at = datetime.fromisoformat(vendor["created_at"])
+    changed_at = datetime.fromisoformat(changes[0]["changed_at"])
+    assert created_at < changed_at
+
+    def city_as_of(timestamp):
+        response = client.get(f"/api/vendors/{vendor_id}/as-of", params={"timestamp": timestamp})
+        assert response.status_code == 200, response.text
+        return response.json()["vendor"]["city"]
+
+    between = created_at + (changed_at - created_at) / 2
+    assert city_as_of(between.isoformat()) == "Berlin"
+    assert city_as_of(changed_at.isoformat()) == "Munich"
+    # The same instant with a UTC offset; the offset is applied, not dropped
+    berlin = timezone(timedelta(hours=2))
+    assert city_as_of(between.replace(tzinfo=timezone.utc).astimezone(berlin).isoformat()) == "Berlin"
+
+    day_before = (created_at - timedelta(days=1)).isoformat()
+    assert client.get(f"/api/vendors/{vendor_id}/as-of", params={"timestamp": day_before}).status_code == 404
+    assert client.get(f"/api/vendors/{vendor_id}/as-of", params={"timestamp": "yesterday"}).status_code == 400
+    assert client.get("/api/vendors/VENDOR999/history").status_code == 404
+
+
+def test_bank_name_follows_the_directory_without_a_bic(client, monkeypatch):
+    monkeypatch.setattr(server, "reference", ReferenceDataLoader(REFERENCE_DIR / "bank_directory.sample.csv"))
+    vendor = create_vendor(client, bank_name="Whatever")
+    assert vendor["bank_name"] == "Commerzbank AG"
+
+    response = client.put(f"/api/vendors/{vendor['vendor_id']}", json={"bank_name": "Free text bank"})
+    assert response.status_code == 200
+    assert response.json()["vendor"]["bank_name"] == "Commerzbank AG"
+    assert client.get(f"/api/vendors/{vendor['vendor_id']}").json()["vendor"]["bank_name"] == "Commerzbank AG"
+
+    batch = client.patch("/api/vendors/batch", json={
+        "vendor_ids": [vendor["vendor_id"]], "update": {"bank_name": "Free text bank"}
+    })
+    assert batch.status_code == 400 and "bank directory" in batch.json()["detail"]
@@ -0,0 +1,84 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from exports import ExportJobManager, ExportLimitExceeded, filter_hash, iter_file_range, parse_range
+from storage.sqlite import SQLiteVendorStore
+
+
+def test_filter_hash_ignores_unset_filters_and_key_order():
+    a = filter_hash({"country": "India", "status": "active", "search": None})
+    b = filter_hash({"status": "active", "search": "", "country": "India"})
+    assert a == b
+    assert a != filter_hash({"country": "India"})
+
+
+def test_parse_range():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == (0, 9)
+    assert parse_range("bytes=90-", 100) == (90, 99)
+    assert parse_range("bytes=-10", 100) == (90, 99)
+    assert parse_range("bytes=50-500", 100) == (50, 99)
+    with pytest.raises(ValueError):
+        parse_range("bytes=100-", 100)
+
+
+def test_iter_file_range_resumes_mid_file(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_bytes(b"0123456789" * 10)
+    assert b"".join(iter_file_range(path, 95, 99, chunk_size=2)) == b"56789"
+
+
+def test_unfinished_jobs_are_capped_per_client_and_overall(tmp_path):
+    store = SQLiteVendorStore(tmp_path / "vendors.db")
+    store.ensure_schema()
+    manager = ExportJobManager(store, tmp_path / "exports", workers=1, max_pending=2, max_pending_per_client=1)
+    release = threading.Event()
+    manager.render_file = lambda job_id, filters: release.wait(5)
+
+    manager.create_job({"country": "India"}, "ip:a")
+    with pytest.raises(ExportLimitExceeded) as per_client:
+        manager.create_job({"country": "France"}, "ip:a")
+    assert per_client.value.status_code == 429
+    # Identical requests reuse the job instead of queueing another
+    assert manager.create_job({"country": "India"}, "ip:b")[1] is True
+    manager.create_job({"country": "France"}, "ip:b")
+    with pytest.raises(ExportLimitExceeded) as overall:
+        manager.create_job({"country": "Canada"}, "ip:c")
+    assert overall.value.status_code == 503
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while manager.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.create_job({"country": "Canada"}, "ip:c")[1] is False
+    manager.shutdown()
+    store.close()
+
+
+def test_jobs_without_a_heartbeat_are_failed_and_not_reused(tmp_path):
+    store = SQLiteVendorStore(tmp_path / "vendors.db")
+    store.ensure_schema()
+    manager = ExportJobManager(store, tmp_path / "exports", workers=1, stale_seconds=60)
+    filters = {"country": "India"}
+    # Left behind by a worker that died mid-render
+    orphan = {
+        "job_id": "orphan", "filter": filters, "filter_hash": filter_hash(filters), "status": "running",
+        "processed": 1000, "total": 5000, "size": None, "error": None,
+        "created_at": datetime.utcnow() - timedelta(seconds=90), "started_at": None, "completed_at": None,
+        "progress_at": datetime.utcnow() - timedelta(seconds=61)
+    }
+    store.insert_export_job(orphan)
+
+    job, reused = manager.create_job(filters, "ip:a")
+    assert reused is False and job["job_id"] != "orphan"
+    assert manager.get_job("orphan")["status"] == "failed"
+
+    deadline = time.monotonic() + 5
+    while manager.get_job(job["job_id"])["status"] != "completed" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.get_job(job["job_id"])["progress_at"] is not None
+    manager.shutdown()
+    store.close()
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from history import apply_diff, compute_diff
+
+
+def test_compute_diff_keeps_only_changed_fields():
+    before = {"_id": 1, "vendor_id": "VENDOR001", "iban": "DE00", "bic": "AAAADEFF", "history_seq": 3}
+    after = {"_id": 1, "vendor_id": "VENDOR001", "iban": "DE11", "bic": "AAAADEFF", "history_seq": 4}
+    assert compute_diff(before, after) == {"iban": ["DE00", "DE11"]}
+
+
+def test_apply_diff_replays_changes_in_order():
+    created = datetime(2024, 1, 1)
+    v0 = {"vendor_id": "VENDOR001", "iban": "DE00", "status": "active", "created_at": created}
+    v1 = {**v0, "iban": "DE11", "updated_at": datetime(2024, 2, 1)}
+    v2 = {**v1, "status": "inactive", "is_deleted": True}
+
+    state = v0
+    for diff in (compute_diff(v0, v1), compute_diff(v1, v2)):
+        state = apply_diff(state, diff)
+    assert state == v2
+
+
+def test_apply_diff_removes_cleared_fields():
+    before = {"vendor_id": "VENDOR001", "documents": {"w9": "x"}}
+    after = {"vendor_id": "VENDOR001"}
+    assert apply_diff(before, compute_diff(before, after)) == after
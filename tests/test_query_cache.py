@@ -0,0 +1,37 @@
+from query_cache import QueryCache, canonical_key, normalize_search
+
+
+def test_canonical_key_normalizes_equivalent_requests():
+    a = canonical_key({"search": normalize_search("  ACME "), "country": "India", "status": None, "offset": 0})
+    b = canonical_key({"offset": 0, "status": "", "country": "India", "search": normalize_search("acme")})
+    assert a == b
+    # Search terms are literal text; backslashes have no special meaning
+    assert normalize_search(r" \S+ ") == r"\s+"
+
+
+def test_bump_invalidates_entries_and_counts_hits():
+    cache = QueryCache()
+    cache.put("k", {"vendors": []}, cache.current_version())
+    assert cache.get("k") == {"vendors": []}
+    cache.bump()
+    assert cache.get("k") is None
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_result_computed_before_a_write_is_not_cached():
+    cache = QueryCache()
+    version = cache.current_version()
+    cache.bump()
+    cache.put("k", {"vendors": []}, version)
+    assert cache.get("k") is None
+
+
+def test_memory_bound_evicts_least_recently_used():
+    cache = QueryCache(max_bytes=600)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"vendors": ["x" * 100]}, 0)
+        cache.get("a")
+    assert cache.bytes <= 600
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] >= 1
@@ -0,0 +1,142 @@
+import os
+import threading
+
+import pytest
+
+import reference_data
+from reference_data import (
+    IBAN_FORMATS_PATH,
+    REFERENCE_DIR,
+    BankDirectory,
+    ReferenceDataLoader,
+    load_iban_formats,
+    validate_iban,
+)
+
+SAMPLE_DIRECTORY = REFERENCE_DIR / "bank_directory.sample.csv"
+
+
+@pytest.fixture(scope="module")
+def iban_formats():
+    return load_iban_formats(IBAN_FORMATS_PATH)
+
+
+def test_iban_validation_uses_checksum_and_registry(iban_formats):
+    assert validate_iban("DE89 3704 0044 0532 0130 00", iban_formats) is None
+    assert validate_iban("GB82WEST12345698765432", iban_formats) is None
+    assert validate_iban("GB82WEST12345698765433", iban_formats) == "Invalid IBAN check digits"
+    assert validate_iban("DE8937040044053201300", iban_formats) == "IBAN for DE must be 22 characters"
+    assert validate_iban("GB821234WEST98765432AB", iban_formats) == "Invalid IBAN format for GB"
+    assert validate_iban("US12345678901234567", iban_formats) == "Invalid IBAN check digits"
+    # Without registry data only shape and check digits are verified
+    assert validate_iban("DE89370400440532013000") is None
+
+
+@pytest.mark.parametrize("iban", [
+    "VA59001123000012345678",
+    "RU0304452522540817810538091310419",
+    "BY13NBRB3600900000002Z00AB00",
+    "SC18SSCB11010000000000001497USD",
+    "LC55HEMM000100010012001200023015",
+    "NI79BAMC00000000000003123123",
+    "YE15CBYE0001018861234567891234",
+])
+def test_registry_covers_recently_added_countries(iban_formats, iban):
+    assert iban[:2] in iban_formats
+    assert validate_iban(iban, iban_formats) is None
+
+
+def test_countries_missing_from_registry_get_shape_and_checksum_checks(iban_formats):
+    stale = {country: entry for country, entry in iban_formats.items() if country != "VA"}
+    assert validate_iban("VA59001123000012345678", stale) is None
+    assert validate_iban("VA59001123000012345679", stale) == "Invalid IBAN check digits"
+
+
+def test_directory_lookup_and_head_office_fallback():
+    banks = BankDirectory([
+        ("DEUTDEFF", "Deutsche  Bank AG"),
+        ("DEUTDEFF500", "Deutsche Bank AG"),
+        ("COBADEFFXXX", "Commerzbank AG"),
+    ])
+    assert len(banks) == 3 and banks.names == ["Commerzbank AG", "Deutsche Bank AG"]
+    assert banks.lookup("deutdeff500").bic == "DEUTDEFF500"
+    assert banks.lookup("DEUTDEFF123").bic == "DEUTDEFFXXX"
+    assert banks.lookup("COBADEFF").to_dict() == {
+        "bic": "COBADEFFXXX", "bank_name": "Commerzbank AG", "country_code": "DE"
+    }
+    assert banks.lookup("BOFAUS3N") is None
+    with pytest.raises(ValueError):
+        BankDirectory([("NOT-A-BIC", "Bank")])
+
+
+def test_autocomplete_matches_word_prefixes():
+    banks = ReferenceDataLoader(SAMPLE_DIRECTORY).current().banks
+    assert [b.bank_name for b in banks.autocomplete("unicr")] == [
+        "UniCredit Bank Austria AG", "UniCredit S.p.A."
+    ]
+    assert [b.bic for b in banks.autocomplete("uni", country_code="at")] == ["BKAUATWWXXX"]
+    assert [b.bank_name for b in banks.autocomplete("bank of")] == ["Bank of America, N.A.", "State Bank of India"]
+    assert banks.autocomplete("deutsche")[0].bic == "DEUTDEFFXXX"
+    assert len(banks.autocomplete("bank", limit=3)) == 3
+    assert banks.autocomplete("  ") == []
+
+
+def refreshed(loader):
+    # Triggers the background check and waits for it
+    loader.current()
+    loader.reload_thread.join()
+    return loader.current()
+
+
+def test_loader_hot_reloads_changed_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(reference_data, "RELOAD_CHECK_SECONDS", 0)
+    path = tmp_path / "banks.csv"
+    path.write_text("bic,bank_name\nCOBADEFFXXX,Commerzbank AG\n")
+    loader = ReferenceDataLoader(path)
+    assert refreshed(loader).banks.lookup("COBADEFF") is not None
+
+    path.write_text("bic,bank_name\nDEUTDEFFXXX,Deutsche Bank AG\n")
+    os.utime(path, ns=(0, 10 ** 18))
+    assert refreshed(loader).banks.lookup("COBADEFF") is None
+    assert loader.current().banks.lookup("DEUTDEFF").bank_name == "Deutsche Bank AG"
+
+    # A broken file keeps the last good snapshot
+    path.write_text("bic,bank_name\nbad,Bank\n")
+    os.utime(path, ns=(0, 2 * 10 ** 18))
+    assert refreshed(loader).banks.lookup("DEUTDEFF") is not None
+    assert loader.stats()["last_error"].startswith("ValueError")
+    assert loader.stats()["reloads"] == 2
+
+
+def test_loader_serves_the_old_snapshot_while_reloading(tmp_path, monkeypatch):
+    monkeypatch.setattr(reference_data, "RELOAD_CHECK_SECONDS", 0)
+    path = tmp_path / "banks.csv"
+    path.write_text("bic,bank_name\nCOBADEFFXXX,Commerzbank AG\n")
+    loader = ReferenceDataLoader(path)
+    started, release = threading.Event(), threading.Event()
+    load_bank_directory = reference_data.load_bank_directory
+
+    def slow_load(bank_path):
+        started.set()
+        release.wait(5)
+        return load_bank_directory(bank_path)
+
+    monkeypatch.setattr(reference_data, "load_bank_directory", slow_load)
+    path.write_text("bic,bank_name\nDEUTDEFFXXX,Deutsche Bank AG\n")
+    os.utime(path, ns=(0, 10 ** 18))
+    assert loader.current().banks.lookup("COBADEFF") is not None
+    assert started.wait(5)
+    # The request path does not block on the parse
+    assert loader.current().banks.lookup("COBADEFF") is not None
+    release.set()
+    loader.reload_thread.join()
+    assert loader.current().banks.lookup("DEUTDEFF") is not None
+
+
+def test_loader_refuses_to_start_on_broken_file(tmp_path):
+    path = tmp_path / "banks.csv"
+    path.write_text("bic,bank_name\nbad,Bank\n")
+    with pytest.raises(ValueError):
+        ReferenceDataLoader(path)
+    # A missing directory just disables BIC lookups
+    assert len(ReferenceDataLoader(tmp_path / "missing.csv").current().banks) == 0
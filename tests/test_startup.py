@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+
+# Cumulative `import server` budget in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "1500"))
+
+# Packages from requirements.txt that must only be imported lazily
+HEAVY_MODULES = ("pandas", "numpy", "boto3", "botocore")
+
+# Deliberately not skipped when the backend dependencies are missing: the
+# test must run wherever backend/requirements.txt is installed (see CI)
+import fastapi  # noqa: E402,F401
+
+
+def run_python(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_server_import_within_budget():
+    result = run_python("import server", "-X", "importtime")
+    # Lines look like: "import time:   self [us] | cumulative | package"
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "server":
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None, result.stderr[-2000:]
+    assert cumulative_us / 1000 <= IMPORT_BUDGET_MS, (
+        f"import server took {cumulative_us / 1000:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_server_import_skips_heavy_modules_and_db():
+    result = run_python(
+        "import sys, server\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+        "print(server.store is None)"
+    )
+    # The first line is empty when no heavy module was imported
+    heavy, no_store = result.stdout.splitlines()
+    assert heavy == ""
+    assert no_store == "True"
@@ -0,0 +1,271 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from history import (
+    build_change_record,
+    create_vendor_with_history,
+    get_vendor_as_of,
+    next_state,
+    update_vendor_with_history,
+    update_vendors_with_history,
+)
+
+# Shared behaviour every storage backend must provide. SQLite always runs;
+# Mongo runs when MONGO_TEST_URL points at a server.
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(params=["sqlite", "mongo"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        from storage.sqlite import SQLiteVendorStore
+        store = SQLiteVendorStore(tmp_path / "vendors.db")
+        store.ensure_schema()
+        yield store
+        store.close()
+    else:
+        url = os.environ.get("MONGO_TEST_URL")
+        if not url:
+            pytest.skip("MONGO_TEST_URL not set")
+        pytest.importorskip("pymongo")
+        from storage.mongo import MongoVendorStore
+        db_name = f"vendordb_test_{uuid.uuid4().hex[:8]}"
+        store = MongoVendorStore(url, db_name=db_name)
+        store.ensure_schema()
+        yield store
+        store.client.drop_database(db_name)
+        store.close()
+
+
+def make_vendor(n, **overrides):
+    vendor = {
+        "id": str(uuid.uuid4()),
+        "vendor_id": f"VENDOR{n:03d}",
+        "company_name": f"Company {n}",
+        "contact_person": f"Contact {n}",
+        "email": f"contact{n}@example.com",
+        "phone": "+1234567890",
+        "street_address": "1 Main St",
+        "city": "Berlin",
+        "postal_code": "10115",
+        "country": "Germany",
+        "bank_name": "Bank",
+        "account_number": "123",
+        "iban": "DE89370400440532013000",
+        "bic": "COBADEFFXXX",
+        "documents": {},
+        "status": "active",
+        "created_at": BASE_TIME + timedelta(days=n),
+        "updated_at": None,
+        "is_deleted": False,
+        "history_seq": 0
+    }
+    vendor.update(overrides)
+    return vendor
+
+
+def seed(store, count=5, **overrides):
+    vendors = [make_vendor(n, **overrides) for n in range(1, count + 1)]
+    for vendor in vendors:
+        store.insert_vendor(vendor)
+    return vendors
+
+
+def test_counters_are_sequential(store):
+    assert store.peek_sequence("vendor_counter") == 0
+    assert [store.next_sequence("vendor_counter") for _ in range(3)] == [1, 2, 3]
+    assert store.peek_sequence("vendor_counter") == 3
+    assert store.next_sequence("other") == 1
+
+
+def test_insert_and_get_round_trip(store):
+    vendor = make_vendor(1, documents={"w9": "file.pdf"})
+    store.insert_vendor(vendor)
+    assert store.get_vendor("VENDOR001") == vendor
+    assert store.get_vendor("VENDOR999") is None
+
+
+def test_find_filters_sorts_and_paginates(store):
+    seed(store, 5)
+    store.insert_vendor(make_vendor(6, country="India", status="inactive"))
+
+    newest_first = [v["vendor_id"] for v in store.find_vendors({})]
+    assert newest_first == [f"VENDOR{n:03d}" for n in range(6, 0, -1)]
+    assert [v["vendor_id"] for v in store.find_vendors({}, limit=2, offset=1)] == ["VENDOR005", "VENDOR004"]
+    assert store.count_vendors({"country": "India"}) == 1
+    assert store.count_vendors({"status": "active"}) == 5
+    assert store.count_vendors({
+        "created_after": BASE_TIME + timedelta(days=2),
+        "created_before": BASE_TIME + timedelta(days=4)
+    }) == 3
+    assert sorted(store.distinct_values("country")) == ["Germany", "India"]
+    assert [v["vendor_id"] for v in store.iter_vendors({"country": "Germany"}, batch_size=2)] == [
+        f"VENDOR{n:03d}" for n in range(5, 0, -1)
+    ]
+
+
+def test_search_is_case_insensitive_substring(store):
+    seed(store, 3)
+    store.insert_vendor(make_vendor(4, company_name="Acme Industrial", email="billing@acme.io"))
+    assert store.find_vendor_ids({"search": "cme ind"}) == ["VENDOR004"]
+    assert store.find_vendor_ids({"search": "ACME"}) == ["VENDOR004"]
+    assert store.count_vendors({"search": "vendor00"}) == 4
+    assert store.count_vendors({"search": "04"}) == 1  # short term fallback
+
+
+def test_search_terms_are_literal(store):
+    store.insert_vendor(make_vendor(1, company_name="A.M. Supplies"))
+    store.insert_vendor(make_vendor(2, company_name="AXM Corp"))
+    store.insert_vendor(make_vendor(3, company_name="Acme (Holdings)"))
+    store.insert_vendor(make_vendor(4, company_name="50% Off Ltd", email="sales@off.example"))
+    store.insert_vendor(make_vendor(5, company_name="Star*Parts", email="x+y@star.example"))
+    assert store.find_vendor_ids({"search": "a.m"}) == ["VENDOR001"]
+    assert store.find_vendor_ids({"search": "acme ("}) == ["VENDOR003"]
+    assert store.find_vendor_ids({"search": "0%"}) == ["VENDOR004"]
+    assert store.find_vendor_ids({"search": "r*p"}) == ["VENDOR005"]
+    assert store.find_vendor_ids({"search": "x+y"}) == ["VENDOR005"]
+    assert store.count_vendors({"search": ".*"}) == 0
+
+
+def test_update_with_history_bumps_sequence_and_logs_change(store):
+    seed(store, 1)
+    before, after = update_vendor_with_history(store, "VENDOR001", {"city": "Munich", "updated_at": BASE_TIME})
+    assert before["city"] == "Berlin" and before["history_seq"] == 0
+    assert store.get_vendor("VENDOR001") == after
+    assert after["city"] == "Munich" and after["history_seq"] == 1
+    assert [(c["seq"], c["changes"]["city"]) for c in store.list_changes("VENDOR001")] == [(1, ["Berlin", "Munich"])]
+    assert update_vendor_with_history(store, "VENDOR999", {"city": "Munich"}) is None
+
+
+def test_soft_deleted_vendors_are_hidden(store):
+    seed(store, 2)
+    assert store.bulk_update_vendors({"VENDOR001": 0}, {"is_deleted": True}) == {"VENDOR001"}
+    assert store.get_vendor("VENDOR001") is None
+    assert store.count_vendors({}) == 1
+    assert store.get_vendors_by_ids(["VENDOR001", "VENDOR002"])[0]["vendor_id"] == "VENDOR002"
+    assert store.vendor_stats(BASE_TIME)["total_vendors"] == 1
+
+
+def test_bulk_update_skips_stale_sequences(store):
+    seed(store, 3)
+    store.bulk_update_vendors({"VENDOR002": 0}, {"city": "Hamburg"})
+    applied = store.bulk_update_vendors(
+        {"VENDOR001": 0, "VENDOR002": 0, "VENDOR003": 0},
+        {"status": "inactive", "updated_at": BASE_TIME}
+    )
+    assert applied == {"VENDOR001", "VENDOR003"}
+    assert store.count_vendors({"status": "inactive"}) == 2
+
+
+def test_bulk_update_partial_match_ignores_identical_earlier_writes(store):
+    seed(store, 3)
+    fields = {"status": "inactive", "updated_at": BASE_TIME}
+    store.bulk_update_vendors({"VENDOR002": 0}, fields)
+    # VENDOR002 already carries the same fields and timestamp, but its
+    # sequence is stale, so this call did not apply to it
+    vendors = {vendor_id: store.get_vendor(vendor_id) for vendor_id in ("VENDOR001", "VENDOR002", "VENDOR003")}
+    records = {
+        vendor_id: build_change_record(vendor, next_state(vendor, fields))
+        for vendor_id, vendor in vendors.items() if vendor_id != "VENDOR002"
+    }
+    applied = store.bulk_update_vendors(
+        {"VENDOR001": 0, "VENDOR002": 0, "VENDOR003": 1}, fields, records
+    )
+    assert applied == {"VENDOR001"}
+    assert [change["vendor_id"] for change in store.list_changes("VENDOR001")] == ["VENDOR001"]
+    assert store.list_changes("VENDOR002") == []
+    assert store.list_changes("VENDOR003") == []
+    assert set(store.get_vendor("VENDOR001")) == set(vendors["VENDOR001"])
+
+
+def test_vendor_stats(store):
+    seed(store, 3)
+    store.insert_vendor(make_vendor(4, country="India", status="inactive"))
+    stats = store.vendor_stats(BASE_TIME + timedelta(days=3))
+    assert stats["total_vendors"] == 4
+    assert stats["active_vendors"] == 3
+    assert stats["inactive_vendors"] == 1
+    assert stats["recent_vendors"] == 2
+    assert stats["country_distribution"] == [{"_id": "Germany", "count": 3}, {"_id": "India", "count": 1}]
+
+
+def test_history_point_in_time_reads(store):
+    vendor = make_vendor(1)
+    create_vendor_with_history(store, vendor)
+
+    changed_at = BASE_TIME + timedelta(days=10)
+    update = {"iban": "DE02120300000000202051", "updated_at": changed_at}
+    update_vendor_with_history(store, "VENDOR001", update)
+
+    assert store.list_changes("VENDOR001")[0]["changes"]["iban"] == [vendor["iban"], update["iban"]]
+    assert get_vendor_as_of(store, "VENDOR001", changed_at - timedelta(seconds=1))["iban"] == vendor["iban"]
+    assert get_vendor_as_of(store, "VENDOR001", changed_at)["iban"] == update["iban"]
+    assert get_vendor_as_of(store, "VENDOR001", BASE_TIME) is None
+
+
+def test_history_is_only_written_for_applied_updates(store):
+    for vendor in (make_vendor(1), make_vendor(2)):
+        create_vendor_with_history(store, vendor)
+    stale = {v["vendor_id"]: v for v in store.get_vendors_by_ids(["VENDOR001", "VENDOR002"])}
+    update_vendor_with_history(store, "VENDOR002", {"city": "Hamburg", "updated_at": BASE_TIME})
+
+    batch_at = BASE_TIME + timedelta(hours=1)
+    applied = update_vendors_with_history(store, stale, {"status": "inactive", "updated_at": batch_at})
+    assert set(applied) == {"VENDOR001"}
+    assert [c["changes"] for c in store.list_changes("VENDOR002")] == [{
+        "city": ["Berlin", "Hamburg"], "updated_at": [None, BASE_TIME]
+    }]
+    assert store.list_changes("VENDOR001")[0]["changes"]["status"] == ["active", "inactive"]
+
+
+def test_failed_history_write_rolls_back_the_update(tmp_path):
+    from storage.sqlite import SQLiteVendorStore
+    store = SQLiteVendorStore(tmp_path / "vendors.db")
+    store.ensure_schema()
+    vendor = make_vendor(1)
+    create_vendor_with_history(store, vendor)
+    update_vendor_with_history(store, "VENDOR001", {"city": "Munich", "updated_at": BASE_TIME})
+
+    # A record that collides with the logged change cannot be written...
+    after = next_state(vendor, {"city": "Hamburg", "updated_at": BASE_TIME})
+    with pytest.raises(Exception):
+        store.bulk_update_vendors({"VENDOR001": 1}, {"city": "Hamburg"}, {
+            "VENDOR001": build_change_record(vendor, after)
+        })
+    # ...so the vendor is left as it was
+    assert store.get_vendor("VENDOR001")["city"] == "Munich"
+    store.close()
+
+
+def test_mongo_history_outbox_survives_a_failed_flush(store, monkeypatch):
+    if store.name != "mongo":
+        pytest.skip("Mongo outbox")
+    create_vendor_with_history(store, make_vendor(1))
+    flush = store.flush_history
+    monkeypatch.setattr(store, "flush_history", lambda vendor_ids=None: None)
+    update_vendor_with_history(store, "VENDOR001", {"city": "Munich", "updated_at": BASE_TIME})
+    assert store.changes.count_documents({}) == 0
+    monkeypatch.setattr(store, "flush_history", flush)
+
+    # History reads flush whatever is still queued on the vendor
+    assert [c["seq"] for c in store.list_changes("VENDOR001")] == [1]
+    assert "pending_history" not in store.vendors.find_one({"vendor_id": "VENDOR001"})
+    assert store.get_vendor("VENDOR001")["city"] == "Munich"
+
+
+def test_export_jobs(store):
+    job = {
+        "job_id": "job-1", "filter": {}, "filter_hash": "abc", "status": "pending",
+        "processed": 0, "created_at": BASE_TIME
+    }
+    store.insert_export_job(job)
+    store.update_export_job("job-1", {"status": "completed", "processed": 10})
+    assert store.get_export_job("job-1")["processed"] == 10
+    assert [j["job_id"] for j in store.find_export_jobs("abc", ["completed"], BASE_TIME)] == ["job-1"]
+    assert store.find_export_jobs("abc", ["pending"], BASE_TIME) == []
+    assert store.expire_export_jobs(BASE_TIME + timedelta(seconds=1)) == ["job-1"]
+    assert store.get_export_job("job-1") is None